@@ -0,0 +1,325 @@
+"""
+Helpers shared by the set and unset workflow timer scripts
+Workflow JSON loading, workflow YAML read/write and the git commit step
+"""
+import functools
+import io
+import json
+import logging
+import os
+import re
+import stat
+import sys
+from _workflow_cache import (
+    cache_dir,
+    cache_key,
+    load_cached_workflow,
+    store_cached_workflow,
+    workflow_cache_path,
+)
+
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib parser
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+def str_representer(dumper, data):
+    """Represent strings, leaving GitHub Actions expressions unquoted"""
+    if '${{' in data:
+        # Don't quote strings with GitHub Actions expressions
+        return dumper.represent_scalar('tag:yaml.org,2002:str', data, style='')
+    return dumper.represent_scalar('tag:yaml.org,2002:str', data)
+
+
+# YAML 1.1 reads these as booleans; GitHub Actions uses 'on' as its trigger key
+_ON_SCALAR_RE = re.compile(r'^(?:on|On|ON)$')
+
+
+@functools.lru_cache(maxsize=None)
+def _yaml_codec():
+    """
+    Import PyYAML on first use and return (yaml, Loader, Dumper)
+    Prefers the libyaml C bindings, falling back to the pure-Python classes
+    when PyYAML was built without them
+    """
+    import yaml
+    try:
+        from yaml import CSafeLoader as BaseLoader, CSafeDumper as BaseDumper
+    except ImportError:
+        from yaml import SafeLoader as BaseLoader, SafeDumper as BaseDumper
+    
+    class Loader(BaseLoader):
+        """YAML loader that reads the GitHub Actions 'on' key as a string"""
+    
+    class Dumper(BaseDumper):
+        """YAML dumper with the workflow string representer registered"""
+    
+    Dumper.add_representer(str, str_representer)
+    
+    # 'on' is a YAML 1.1 boolean; resolve it as a string ahead of the bool
+    # resolver so the trigger key reads and writes as plain 'on'
+    for cls in (Loader, Dumper):
+        resolvers = dict(cls.yaml_implicit_resolvers)
+        for first in 'oO':
+            resolvers[first] = [('tag:yaml.org,2002:str', _ON_SCALAR_RE)] + resolvers.get(first, [])
+        cls.yaml_implicit_resolvers = resolvers
+    return yaml, Loader, Dumper
+
+
+def _yaml_cache_path(yaml_path):
+    """JSON mirror of a workflow YAML file, stored alongside the parse caches, or None"""
+    directory = cache_dir()
+    if directory is None:
+        return None
+    return os.path.join(directory, f"{cache_key(yaml_path)}.yaml.json")
+
+
+def _load_cached_yaml(yaml_path):
+    """Return the JSON mirror of yaml_path if it matches the file's mtime and size, else None"""
+    cache_path = _yaml_cache_path(yaml_path)
+    if cache_path is None:
+        return None
+    try:
+        with open(cache_path, 'r') as f:
+            cached = json.load(f)
+        st = os.stat(yaml_path)
+        if cached["mtime_ns"] == st.st_mtime_ns and cached["size"] == st.st_size:
+            return cached["workflow"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def _store_cached_yaml(yaml_path, workflow_yaml):
+    """Write the JSON mirror of a freshly read or written YAML file (best effort)"""
+    cache_path = _yaml_cache_path(yaml_path)
+    if cache_path is None:
+        return
+    try:
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        st = os.stat(yaml_path)
+        with open(tmp_path, 'w') as f:
+            json.dump({"mtime_ns": st.st_mtime_ns, "size": st.st_size, "workflow": workflow_yaml}, f)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug(f"Could not cache workflow YAML: {e}")
+
+
+def preflight(workflow_file, *env_names):
+    """
+    Check the cheap preconditions before any parsing: every named environment
+    variable is set and the workflow file exists. Reports all failures at once
+    Returns the environment values in the order given
+    """
+    values = [os.environ.get(name) for name in env_names]
+    failed = False
+    for name, value in zip(env_names, values):
+        if not value:
+            logger.error(f"{name} environment variable not set")
+            failed = True
+    
+    if not os.path.isfile(workflow_file):
+        logger.error(f"Workflow file not found: {workflow_file}")
+        failed = True
+    
+    if failed:
+        sys.exit(1)
+    return values
+
+
+def load_workflow_json(workflow_path):
+    """Load and parse the workflow JSON file, reusing a cached parse if it is unchanged"""
+    path = os.path.abspath(workflow_path)
+    try:
+        st = os.stat(path)
+    except OSError:
+        st = None
+    if st is None or not stat.S_ISREG(st.st_mode):
+        logger.error(f"Workflow file not found: {workflow_path}")
+        sys.exit(1)
+    
+    cache_path = workflow_cache_path(path, st)
+    workflow_data = load_cached_workflow(cache_path)
+    if workflow_data is None:
+        try:
+            with open(path, 'rb') as f:
+                buf = f.read()
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            workflow_data = orjson.loads(buf) if orjson else json.loads(buf)
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse workflow JSON: {e}")
+            sys.exit(1)
+        store_cached_workflow(cache_path, workflow_data)
+    
+    return workflow_data
+
+
+def get_entry_action(workflow_data):
+    """Get the entry action (FunctionInvoke) from workflow"""
+    entry_action = workflow_data.get("FunctionInvoke")
+    if not entry_action:
+        logger.error("FunctionInvoke not found in workflow JSON")
+        sys.exit(1)
+    
+    if entry_action not in workflow_data.get("ActionList", {}):
+        logger.error(f"Entry action '{entry_action}' not found in ActionList")
+        sys.exit(1)
+    
+    logger.info(f"Entry action: {entry_action}")
+    return entry_action
+
+
+def get_workflow_yaml_path(workflow_name, entry_action):
+    """Get the path to the workflow YAML file"""
+    workflow_file = f"{workflow_name}-{entry_action}.yml"
+    yaml_path = f".github/workflows/{workflow_file}"
+    
+    return yaml_path, workflow_file
+
+
+def read_workflow_yaml(yaml_path):
+    """Read existing workflow YAML file, reusing a cached parse if it is unchanged"""
+    workflow_yaml = _load_cached_yaml(yaml_path)
+    if workflow_yaml is not None:
+        return workflow_yaml
+    
+    yaml, loader, _ = _yaml_codec()
+    try:
+        with open(yaml_path, 'r') as f:
+            workflow_yaml = yaml.load(f, Loader=loader)
+    except yaml.YAMLError as e:
+        logger.error(f"Failed to parse workflow YAML: {e}")
+        sys.exit(1)
+    except Exception as e:
+        logger.error(f"Failed to read workflow YAML: {e}")
+        sys.exit(1)
+    
+    _store_cached_yaml(yaml_path, workflow_yaml)
+    return workflow_yaml
+
+
+def write_text_atomic(path, text):
+    """Write text to a temporary file beside path and rename it into place"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'w') as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def write_workflow_yaml(yaml_path, workflow_yaml):
+    """Write updated workflow YAML back to file with proper key ordering"""
+    try:
+        # CRITICAL FIX: Put the top-level keys in the correct order in place:
+        # name, on, jobs, then any other keys. Re-inserting a key moves it to
+        # the end without copying its value
+        leading = [key for key in ('name', 'on', 'jobs') if key in workflow_yaml]
+        trailing = [key for key in workflow_yaml if key not in ('name', 'on', 'jobs')]
+        for key in leading + trailing:
+            workflow_yaml[key] = workflow_yaml.pop(key)
+        
+        # Dump YAML with ordered structure straight into one buffer
+        yaml, _, dumper = _yaml_codec()
+        buf = io.StringIO()
+        yaml.dump(
+            workflow_yaml,
+            buf,
+            Dumper=dumper,
+            default_flow_style=False,
+            sort_keys=False,
+            width=1000,
+            allow_unicode=True
+        )
+        
+        write_text_atomic(yaml_path, buf.getvalue())
+        _store_cached_yaml(yaml_path, workflow_yaml)
+        
+        logger.info(f"✓ Wrote updated YAML to: {yaml_path}")
+        
+    except Exception as e:
+        logger.error(f"Failed to write workflow YAML: {e}")
+        sys.exit(1)
+
+
+# Registered workflow YAML is normally patched as text, which keeps its
+# layout and skips the YAML round-trip. Anything unexpected makes the
+# text patchers return None and the parsed path is used instead
+_ON_BLOCK_RE = re.compile(r"""^(?:on|true|"on"|'on'):[ \t]*\n((?:[ \t]*\n|[ \t]+\S.*\n)*)""", re.M)
+SCHEDULE_BLOCK_RE = re.compile(r'^([ \t]+)schedule:[ \t]*\n(?:\1(?:[ \t]+|- ).*\n)*', re.M)
+ENV_LINE_RE = re.compile(r'^[ \t]+(OVERWRITTEN|PAYLOAD_URL):[ \t]+(\S.*?)[ \t]*$', re.M)
+
+
+def split_on_block(text):
+    """
+    Split workflow YAML text around the body of its top-level 'on' block
+    Returns (head, on_body, rest, indent of the block's keys), or None when
+    the layout is not recognised
+    """
+    matches = list(_ON_BLOCK_RE.finditer(text))
+    if len(matches) != 1 or not text.endswith('\n'):
+        return None
+    match = matches[0]
+    rest = text[match.end():]
+    if rest and not re.match(r'[^\s#]', rest):
+        return None
+    on_body = match.group(1)
+    child = re.match(r'(?:[ \t]*\n)*([ \t]+)\S', on_body)
+    if not child:
+        return None
+    return text[:match.start(1)], on_body, rest, child.group(1)
+
+
+def find_input_block(on_body, key):
+    """
+    Locate a workflow_dispatch input in 'on' block text (group 2 is its body)
+    Returns None if the input is absent, or False if it cannot be located
+    unambiguously
+    """
+    block = re.search(rf'^([ \t]+){key}:[ \t]*\n((?:\1[ \t]+\S.*\n|[ \t]*\n)*)', on_body, re.M)
+    if len(re.findall(rf'^[ \t]+{key}:', on_body, re.M)) != (1 if block else 0):
+        return False
+    return block
+
+
+def commit_and_push(yaml_path, commit_msg, branch, no_change_msg):
+    """Commit the workflow YAML alone and push it to GitHub"""
+    import subprocess
+    try:
+        # Commit only the workflow YAML; git exits non-zero when it is unchanged
+        result = subprocess.run(
+            ['git', 'commit', '-o', yaml_path, '-m', commit_msg],
+            capture_output=True,
+            text=True
+        )
+        
+        if result.returncode != 0:
+            if "nothing to commit" in result.stdout or "no changes added to commit" in result.stdout:
+                logger.info(no_change_msg)
+                return
+            raise subprocess.CalledProcessError(
+                result.returncode, result.args, result.stdout, result.stderr
+            )
+        
+        subprocess.run(
+            ['git', 'push', 'origin', branch],
+            check=True,
+            capture_output=True,
+            text=True
+        )
+        
+        logger.info(f"✓ Committed and pushed to branch: {branch}")
+        
+    except subprocess.CalledProcessError as e:
+        logger.error("Git operation failed")
+        if e.stdout:
+            logger.error(f"Output: {e.stdout}")
+        if e.stderr:
+            logger.error(f"Error: {e.stderr}")
+        sys.exit(1)
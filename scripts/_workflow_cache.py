@@ -0,0 +1,83 @@
+"""
+On-disk cache of parsed workflow files, shared across runs
+Used by the registration and timer scripts; entries are pickles, so the
+cache directory is only used when it is private to the current user
+"""
+import functools
+import glob
+import hashlib
+import logging
+import os
+import pickle
+import stat
+import tempfile
+
+logger = logging.getLogger(__name__)
+
+# Kept out of the repository; FAASR_CACHE_DIR overrides the per-user default
+_CACHE_DIR = os.environ.get(
+    "FAASR_CACHE_DIR", os.path.join(tempfile.gettempdir(), f"faasr-workflow-cache-{os.getuid()}")
+)
+
+
+@functools.lru_cache(maxsize=None)
+def cache_dir():
+    """
+    Return the cache directory, creating it if needed, or None if it cannot
+    be trusted: it must be a real directory (not a symlink) owned by the
+    current user with no group or other permissions, since anyone who can
+    write to it can run code through a planted pickle
+    """
+    try:
+        os.makedirs(_CACHE_DIR, mode=0o700, exist_ok=True)
+        st = os.lstat(_CACHE_DIR)
+    except OSError as e:
+        logger.debug(f"Workflow cache disabled: {e}")
+        return None
+    if (not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid()
+            or st.st_mode & 0o077):
+        logger.debug(f"Workflow cache disabled: {_CACHE_DIR} is not private to this user")
+        return None
+    return _CACHE_DIR
+
+
+def cache_key(path):
+    """Cache file name prefix for a file path"""
+    return hashlib.sha1(os.path.abspath(path).encode()).hexdigest()[:16]
+
+
+def workflow_cache_path(path, st):
+    """Pickle cache file for a workflow file at its current mtime and size, or None"""
+    directory = cache_dir()
+    if directory is None:
+        return None
+    return os.path.join(directory, f"{cache_key(path)}.{st.st_mtime_ns}.{st.st_size}.pkl")
+
+
+def load_cached_workflow(cache_path):
+    """Load a pickled workflow parse, or None if there is no usable cache"""
+    if cache_path is None:
+        return None
+    try:
+        with open(cache_path, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        # Missing, truncated or written by an incompatible version
+        return None
+
+
+def store_cached_workflow(cache_path, workflow_data):
+    """Pickle a workflow parse, replacing caches for older versions (best effort)"""
+    if cache_path is None:
+        return
+    try:
+        directory, name = os.path.split(cache_path)
+        prefix = name.split(".", 1)[0]
+        for stale in glob.glob(os.path.join(directory, f"{prefix}.*.pkl")):
+            os.remove(stale)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(workflow_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.debug(f"Could not cache workflow parse: {e}")
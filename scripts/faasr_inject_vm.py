@@ -20,6 +20,7 @@ Available Strategies:
 Usage:
     python faasr_inject_vm.py --input workflow.json --strategy parallel
     python faasr_inject_vm.py --input workflow.json --strategy sequential --output custom.json
+    python faasr_inject_vm.py --input workflow.json --verbose
 """
 
 import argparse
@@ -27,20 +28,68 @@ import json
 import sys
 import logging
 from pathlib import Path
-from copy import deepcopy
 import os
+from collections import defaultdict, deque
+from itertools import chain
+
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib parser/serializer
+    orjson = None
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(levelname)s: %(message)s",
-    stream=sys.stdout
-)
 logger = logging.getLogger(__name__)
 
+# Key order of every injected action; FunctionName, FaaSServer and InvokeNext
+# are filled in per action
+_BUILTIN_ACTION_TEMPLATE = {
+    "FunctionName": None,
+    "FaaSServer": None,
+    "Type": "Python",
+    "RequiresVM": False,
+    "InvokeNext": None,
+    "_faasr_builtin": True
+}
+
+
+def _replace_in_place(items, old, new):
+    """
+    Replace every occurrence of old with new in a list, in place.
+    
+    Returns:
+        bool: True if any element was replaced
+    """
+    modified = False
+    i = 0
+    try:
+        while True:
+            # Resume after the last hit rather than rescanning the prefix
+            i = items.index(old, i)
+            items[i] = new
+            modified = True
+            i += 1
+    except ValueError:
+        pass
+    return modified
+
+
+def _invoke_targets(item):
+    """Action names referenced by one item of a canonical InvokeNext list."""
+    if type(item) is dict:
+        return chain.from_iterable(
+            actions if type(actions) is list else (actions,) for actions in item.values()
+        )
+    return (item,)
+
 
 class VMInjectionTool:
     """Tool to inject VM orchestration actions into FaaSr workflows."""
     
+    __slots__ = (
+        "workflow_path", "output_path", "workflow",
+        "_invoke_next_original", "_graph_index", "_graph_analysis_result",
+        "_leaves", "_vm_actions", "_server_to_container", "_action_names", "_github_server",
+    )
+    
     def __init__(self, workflow_path, output_path=None):
         """
         Initialize tool.
@@ -59,113 +108,292 @@ class VMInjectionTool:
             self.output_path = self.workflow_path.parent / f"{stem}_augmented{suffix}"
         
         self.workflow = None
-        self.original_workflow = None
+        self._invoke_next_original = {}
+        self._graph_index = None
+        self._graph_analysis_result = None
+        self._vm_actions = []
+        self._server_to_container = {}
+        self._action_names = set()
+        self._github_server = None
+        self._leaves = []
     
     def load_workflow(self):
         """Load and validate input workflow."""
-        logger.info(f"Loading workflow from: {self.workflow_path}")
+        logger.info("Loading workflow from: %s", self.workflow_path)
         
         if not self.workflow_path.exists():
             raise FileNotFoundError(f"Workflow file not found: {self.workflow_path}")
         
-        with open(self.workflow_path, 'r') as f:
-            self.workflow = json.load(f)
+        data = self.workflow_path.read_bytes()
+        self.workflow = orjson.loads(data) if orjson else json.loads(data)
         
-        self.original_workflow = deepcopy(self.workflow)
+        # Drop the analysis cached against a previously loaded workflow
+        self._graph_analysis_result = None
+        
+        self._canonicalize_invoke_next()
+        self._index_workflow()
+        if self._vm_actions:
+            logger.info("Found %d VM-requiring actions: %s", len(self._vm_actions), self._vm_actions)
+        
+        self._github_server = next(
+            (
+                server_name
+                for server_name, server_config in self.workflow.get("ComputeServers", {}).items()
+                if server_config.get("FaaSType") == "GitHubActions"
+            ),
+            None,
+        )
         
         logger.info("Workflow loaded successfully")
     
     def needs_vm(self):
         """Check if workflow has any VM-requiring actions."""
+        return bool(self._vm_actions)
+    
+    def _canonicalize_invoke_next(self):
+        """
+        Rewrite every InvokeNext as a list of action names and conditional dicts.
+        
+        A bare string or conditional dict is wrapped in a list and any other
+        falsy value becomes an empty list (a leaf); the original
+        value is kept in _invoke_next_original so save_workflow can restore
+        its shape. Action names are interned (ActionList keys and InvokeNext
+        entries) so the repeated name comparisons during injection are
+        mostly identity checks.
+        """
+        self._invoke_next_original = {}
+        
         if "ActionList" not in self.workflow:
-            return False
+            return
+        
+        self.workflow["ActionList"] = {
+            sys.intern(name): config for name, config in self.workflow["ActionList"].items()
+        }
         
         for action_name, action_config in self.workflow["ActionList"].items():
-            if action_config.get("RequiresVM", False):
-                logger.info(f"Found VM-requiring action: {action_name}")
-                return True
+            invoke_next = action_config.get("InvokeNext", [])
+            if not isinstance(invoke_next, list):
+                # Any falsy value ("", null, {}) marks a leaf, as it did before
+                self._invoke_next_original[action_name] = invoke_next
+                invoke_next = action_config["InvokeNext"] = [invoke_next] if invoke_next else []
+            
+            for i, item in enumerate(invoke_next):
+                if isinstance(item, str):
+                    invoke_next[i] = sys.intern(item)
+                elif isinstance(item, dict):
+                    for condition, actions in item.items():
+                        if isinstance(actions, list):
+                            item[condition] = [
+                                sys.intern(a) if isinstance(a, str) else a for a in actions
+                            ]
+                        elif isinstance(actions, str):
+                            item[condition] = sys.intern(actions)
+    
+    def _restore_invoke_next_format(self):
+        """Put back InvokeNext values that were not a list on load."""
+        action_list = self.workflow.get("ActionList", {})
         
-        return False
+        for action_name, original in self._invoke_next_original.items():
+            invoke_next = action_list[action_name].get("InvokeNext")
+            # Leaves redirected to vm_stop no longer match the original shape
+            if not original:
+                if invoke_next == []:
+                    action_list[action_name]["InvokeNext"] = original
+            elif isinstance(invoke_next, list) and len(invoke_next) == 1 \
+                    and type(invoke_next[0]) is type(original):
+                action_list[action_name]["InvokeNext"] = invoke_next[0]
     
-    def find_entry_action(self):
+    @staticmethod
+    def _normalize_invoke_next(invoke_next):
         """
-        Find the entry point action (no predecessors).
+        Flatten a canonical InvokeNext list into successor names.
         
+        Items are either action names or conditional dicts like
+        {"True": [...], "False": [...]}.
+        
+        Args:
+            invoke_next: Canonical InvokeNext list from an action
+            
         Returns:
-            str: Name of entry action
+            tuple: Successor action names
+        """
+        return tuple(chain.from_iterable(map(_invoke_targets, invoke_next)))
+    
+    def _index_workflow(self):
+        """
+        Index the loaded workflow in a single pass over ActionList.
+        
+        Each action's InvokeNext is normalized once and feeds every lookup
+        the injection strategies need:
+        
+            _graph_index: "successors" and "predecessors" (name -> list of
+                names), "successor_sets" (name -> set of names, for
+                membership checks) and "indegree" (name -> int); kept in
+                step with the ActionList as actions are injected
+            _leaves, _vm_actions: leaf and VM-requiring actions
+            _server_to_container: first container image seen for each server
+        
+        Everything except _graph_index describes the workflow as loaded and
+        is not updated by injection.
         """
         action_list = self.workflow.get("ActionList", {})
+        action_containers = self.workflow.get("ActionContainers", {})
         
-        # Build predecessor count
-        predecessor_count = {name: 0 for name in action_list.keys()}
+        names = list(action_list)
+        successors = {}
+        successor_sets = {}
+        predecessors = defaultdict(list)
+        indegree = dict.fromkeys(names, 0)
+        leaves = []
+        vm_actions = []
+        server_to_container = {}
         
         for action_name, action_config in action_list.items():
-            invoke_next = action_config.get("InvokeNext", [])
+            next_actions = self._normalize_invoke_next(action_config.get("InvokeNext", []))
+            successors[action_name] = list(next_actions)
+            successor_sets[action_name] = set(next_actions)
+            if not next_actions:
+                leaves.append(action_name)
             
-            # Handle different InvokeNext formats
-            if isinstance(invoke_next, str):
-                invoke_next = [invoke_next]
-            elif isinstance(invoke_next, list) and len(invoke_next) > 0:
-                # Check if list contains conditional dicts
-                if isinstance(invoke_next[0], dict):
-                    # Extract all actions from conditional branches
-                    next_actions = []
-                    for conditional_dict in invoke_next:
-                        for condition, actions in conditional_dict.items():
-                            if isinstance(actions, list):
-                                next_actions.extend(actions)
-                            else:
-                                next_actions.append(actions)
-                    invoke_next = next_actions
-            elif isinstance(invoke_next, dict):
-                # Direct dict (not in a list)
-                next_actions = []
-                for condition, actions in invoke_next.items():
-                    if isinstance(actions, list):
-                        next_actions.extend(actions)
-                    else:
-                        next_actions.append(actions)
-                invoke_next = next_actions
+            for next_action in next_actions:
+                # Edges to undeclared actions are not counted
+                if next_action not in indegree:
+                    continue
+                indegree[next_action] += 1
+                # An action may name the same successor in several branches;
+                # record it as a predecessor only once
+                preds = predecessors[next_action]
+                if not preds or preds[-1] != action_name:
+                    preds.append(action_name)
             
-            for next_action in invoke_next:
-                if next_action in predecessor_count:
-                    predecessor_count[next_action] += 1
+            if action_config.get("RequiresVM", False):
+                vm_actions.append(action_name)
+            
+            server_name = action_config.get("FaaSServer")
+            container = action_containers.get(action_name)
+            if server_name and container and server_name not in server_to_container:
+                server_to_container[server_name] = container
+        
+        self._graph_index = {
+            "successors": successors,
+            "successor_sets": successor_sets,
+            "predecessors": predecessors,
+            "indegree": indegree,
+        }
+        self._leaves = leaves
+        self._vm_actions = vm_actions
+        self._server_to_container = server_to_container
+        self._action_names = set(names)
+    
+    def _index_action(self, action_name):
+        """
+        Add (or re-add) the outgoing edges of an action to the graph index.
+        
+        Used after injecting an action or rewriting a leaf's InvokeNext so
+        the index keeps matching the ActionList.
+        
+        Args:
+            action_name: Action whose InvokeNext should be indexed
+        """
+        index = self._graph_index
+        action_config = self.workflow["ActionList"][action_name]
+        next_actions = self._normalize_invoke_next(action_config.get("InvokeNext", []))
+        
+        index["successors"][action_name] = list(next_actions)
+        index["successor_sets"][action_name] = set(next_actions)
+        index["indegree"].setdefault(action_name, 0)
+        
+        for next_action in next_actions:
+            if next_action not in index["indegree"]:
+                continue
+            index["indegree"][next_action] += 1
+            preds = index["predecessors"][next_action]
+            if action_name not in preds:
+                preds.append(action_name)
+    
+    def _analyze_graph(self):
+        """
+        Analyze the workflow graph with a single pass of Kahn's algorithm.
+        
+        Returns:
+            tuple: (entry action, leaf actions, topological order, predecessors)
+        """
+        index = self._graph_index
+        successors = index["successors"]
+        indegree = dict(index["indegree"])
         
         # Find action(s) with zero predecessors
-        entry_actions = [name for name, count in predecessor_count.items() if count == 0]
+        entry_actions = [name for name, count in indegree.items() if count == 0]
         
         if len(entry_actions) == 0:
             raise ValueError("No entry action found (cycle in workflow?)")
         elif len(entry_actions) > 1:
             raise ValueError(f"Multiple entry actions found: {entry_actions}. Workflow must have single entry point.")
         
-        return entry_actions[0]
+        leaves = self._leaves
+        
+        if not leaves:
+            raise ValueError("No leaf actions found - workflow must have terminal nodes")
+        
+        queue = deque(entry_actions)
+        topo_order = []
+        while queue:
+            action_name = queue.popleft()
+            topo_order.append(action_name)
+            for next_action in successors[action_name]:
+                if next_action in indegree:
+                    indegree[next_action] -= 1
+                    if indegree[next_action] == 0:
+                        queue.append(next_action)
+        
+        if len(topo_order) < len(indegree):
+            remaining = [name for name, count in indegree.items() if count > 0]
+            raise ValueError(f"Cycle detected in workflow: {remaining}")
+        
+        return entry_actions[0], leaves, topo_order, index["predecessors"]
+    
+    @property
+    def _graph_analysis(self):
+        """Graph analysis of the workflow as loaded, before any injection."""
+        # Memoized in a slot: __slots__ leaves no __dict__ for cached_property
+        if self._graph_analysis_result is None:
+            self._graph_analysis_result = self._analyze_graph()
+        return self._graph_analysis_result
     
-    def find_leaf_actions(self):
+    @property
+    def entry_action(self):
         """
-        Find all leaf actions (empty InvokeNext).
+        Entry point action (no predecessors).
         
         Returns:
-            list: Names of leaf actions
+            str: Name of entry action
         """
-        action_list = self.workflow.get("ActionList", {})
-        leaves = []
-        
-        for action_name, action_config in action_list.items():
-            invoke_next = action_config.get("InvokeNext", [])
-            
-            # Check if empty
-            if not invoke_next or invoke_next == []:
-                leaves.append(action_name)
+        return self._graph_analysis[0]
+    
+    @property
+    def leaf_actions(self):
+        """
+        All leaf actions (empty InvokeNext).
         
-        if not leaves:
-            raise ValueError("No leaf actions found - workflow must have terminal nodes")
+        Returns:
+            list: Names of leaf actions
+        """
+        return self._graph_analysis[1]
+    
+    @property
+    def topo_order(self):
+        """
+        Actions in topological order, starting from the entry action.
         
-        return leaves
+        Returns:
+            list: Names of all actions in the workflow as loaded
+        """
+        return self._graph_analysis[2]
     
-    def find_github_server(self):
+    @property
+    def github_server(self):
         """
-        Find a GitHub Actions server for injected actions.
+        GitHub Actions server for injected actions.
         
         Returns:
             str: Server name
@@ -173,11 +401,20 @@ class VMInjectionTool:
         if "ComputeServers" not in self.workflow:
             raise ValueError("No ComputeServers defined in workflow")
         
-        for server_name, server_config in self.workflow["ComputeServers"].items():
-            if server_config.get("FaaSType") == "GitHubActions":
-                return server_name
+        if self._github_server is None:
+            raise ValueError("No GitHub Actions server found. VM workflows require GitHub Actions.")
         
-        raise ValueError("No GitHub Actions server found. VM workflows require GitHub Actions.")
+        return self._github_server
+    
+    @property
+    def default_container(self):
+        """
+        Container image for injected actions (the GitHub server's container).
+        
+        Returns:
+            str: Container image or None
+        """
+        return self.find_container_for_server(self.github_server)
     
     def find_container_for_server(self, server_name):
         """
@@ -189,17 +426,67 @@ class VMInjectionTool:
         Returns:
             str: Container image or None
         """
-        action_containers = self.workflow.get("ActionContainers", {})
-        action_list = self.workflow.get("ActionList", {})
+        return self._server_to_container.get(server_name)
+    
+    def _check_name_conflicts(self, new_names):
+        """
+        Ensure none of the names to be injected already exist in the workflow.
         
-        # Find any action using this server
-        for action_name, action_config in action_list.items():
-            if action_config.get("FaaSServer") == server_name:
-                container = action_containers.get(action_name)
-                if container:
-                    return container
+        Args:
+            new_names: Names of the actions about to be injected
+        """
+        conflicts = [name for name in new_names if name in self._action_names]
+        if conflicts:
+            verb = "exists" if len(conflicts) == 1 else "exist"
+            raise ValueError(f"Action name conflict: {', '.join(conflicts)} already {verb}")
+    
+    @staticmethod
+    def _redirect_invoke_next(action_config, old_name, new_name):
+        """
+        Replace references to one action with another in a canonical InvokeNext list.
+        
+        Conditional branches keep their shape; only matching names change.
+        
+        Args:
+            action_config: Action whose InvokeNext should be rewritten
+            old_name: Action name to replace
+            new_name: Replacement action name
+            
+        Returns:
+            bool: True if InvokeNext was modified
+        """
+        invoke_next = action_config.get("InvokeNext", [])
+        modified = _replace_in_place(invoke_next, old_name, new_name)
+        
+        for item in invoke_next:
+            if not isinstance(item, dict):
+                continue
+            # Conditional dict like {"True": [...], "False": [...]}
+            for condition, actions in item.items():
+                if isinstance(actions, list):
+                    if _replace_in_place(actions, old_name, new_name):
+                        modified = True
+                elif actions == old_name:
+                    item[condition] = new_name
+                    modified = True
+        
+        return modified
+    
+    @staticmethod
+    def _builtin_action_template(github_server):
+        """
+        Skeleton shared by all injected actions.
         
-        return None
+        Callers copy it and fill in FunctionName and InvokeNext; the keys come
+        from _BUILTIN_ACTION_TEMPLATE so the copies keep its key order.
+        
+        Args:
+            github_server: GitHub Actions server running the injected actions
+            
+        Returns:
+            dict: Action template
+        """
+        return dict(_BUILTIN_ACTION_TEMPLATE, FaaSServer=github_server)
     
     def inject_vm_actions_sequential(self):
         """
@@ -220,49 +507,44 @@ class VMInjectionTool:
             raise ValueError("VMConfig required for VM workflows")
         
         # Find graph structure
-        entry_action = self.find_entry_action()
-        leaf_actions = self.find_leaf_actions()
-        github_server = self.find_github_server()
-        container = self.find_container_for_server(github_server)
+        # Analyzed on first access, i.e. before the graph is modified
+        entry_action = self.entry_action
+        leaf_actions = self.leaf_actions
+        github_server = self.github_server
+        container = self.default_container
         
-        logger.info(f"Entry action: {entry_action}")
-        logger.info(f"Leaf actions: {leaf_actions}")
-        logger.info(f"GitHub server: {github_server}")
+        logger.info("Entry action: %s", entry_action)
+        logger.info("Leaf actions: %s", leaf_actions)
+        logger.info("GitHub server: %s", github_server)
         
         # Define injected action names
-        vm_start_name = "faasr-vm-start"
-        vm_stop_name = "faasr-vm-stop"
+        vm_start_name = sys.intern("faasr-vm-start")
+        vm_stop_name = sys.intern("faasr-vm-stop")
+        
+        # Check for name conflicts before modifying anything
+        self._check_name_conflicts([vm_start_name, vm_stop_name])
         
-        # Check for name conflicts
-        if vm_start_name in self.workflow["ActionList"]:
-            raise ValueError(f"Action name conflict: {vm_start_name} already exists")
-        if vm_stop_name in self.workflow["ActionList"]:
-            raise ValueError(f"Action name conflict: {vm_stop_name} already exists")
+        template = self._builtin_action_template(github_server)
+        action_list = self.workflow["ActionList"]
         
         # Create VM start action
-        self.workflow["ActionList"][vm_start_name] = {
-            "FunctionName": "vm_start",
-            "FaaSServer": github_server,
-            "Type": "Python",
-            "RequiresVM": False,
-            "InvokeNext": [entry_action],
-            "_faasr_builtin": True
-        }
+        action_list[vm_start_name] = dict(
+            template, FunctionName="vm_start", InvokeNext=[entry_action]
+        )
         
         # Create VM stop action
-        self.workflow["ActionList"][vm_stop_name] = {
-            "FunctionName": "vm_stop",
-            "FaaSServer": github_server,
-            "Type": "Python",
-            "RequiresVM": False,
-            "InvokeNext": [],
-            "_faasr_builtin": True
-        }
+        action_list[vm_stop_name] = dict(
+            template, FunctionName="vm_stop", InvokeNext=[]
+        )
+        self._action_names.update((vm_start_name, vm_stop_name))
+        self._index_action(vm_start_name)
+        self._index_action(vm_stop_name)
         
         # Modify leaf actions to point to stop
         for leaf_name in leaf_actions:
-            self.workflow["ActionList"][leaf_name]["InvokeNext"] = [vm_stop_name]
-            logger.info(f"Modified leaf '{leaf_name}' to invoke VM stop")
+            action_list[leaf_name]["InvokeNext"] = [vm_stop_name]
+            self._index_action(leaf_name)
+        logger.info("Redirected %d leaf action(s) to %s", len(leaf_actions), vm_stop_name)
         
         # Add containers for injected actions
         if "ActionContainers" not in self.workflow:
@@ -274,7 +556,7 @@ class VMInjectionTool:
         
         # Update FunctionInvoke to point to vm_start
         self.workflow["FunctionInvoke"] = vm_start_name
-        logger.info(f"Updated FunctionInvoke to: {vm_start_name}")
+        logger.info("Updated FunctionInvoke to: %s", vm_start_name)
         
         logger.info("VM actions injected successfully")
 
@@ -300,144 +582,91 @@ class VMInjectionTool:
         if "VMConfig" not in self.workflow:
             raise ValueError("VMConfig required for VM workflows")
         
-        entry_action = self.find_entry_action()
-        leaf_actions = self.find_leaf_actions()
-        github_server = self.find_github_server()
-        container = self.find_container_for_server(github_server)
+        # Analyzed on first access, i.e. before the graph is modified
+        entry_action = self.entry_action
+        leaf_actions = self.leaf_actions
+        predecessors = self._graph_analysis[3]
+        github_server = self.github_server
+        container = self.default_container
         
-        logger.info(f"Entry action: {entry_action}")
-        logger.info(f"Leaf actions: {leaf_actions}")
+        logger.info("Entry action: %s", entry_action)
+        logger.info("Leaf actions: %s", leaf_actions)
         
         # Define injected action names
-        vm_start_name = "faasr-vm-start"
-        vm_stop_name = "faasr-vm-stop"
-        
-        # Check for name conflicts
-        if vm_start_name in self.workflow["ActionList"]:
-            raise ValueError(f"Action name conflict: {vm_start_name} already exists")
-        if vm_stop_name in self.workflow["ActionList"]:
-            raise ValueError(f"Action name conflict: {vm_stop_name} already exists")
+        vm_start_name = sys.intern("faasr-vm-start")
+        vm_stop_name = sys.intern("faasr-vm-stop")
         
-        # Create VM start action (fire and forget)
-        self.workflow["ActionList"][vm_start_name] = {
-            "FunctionName": "vm_start",
-            "FaaSServer": github_server,
-            "Type": "Python",
-            "RequiresVM": False,
-            "InvokeNext": [entry_action],
-            "_faasr_builtin": True
+        poll_action_names = {
+            vm_action_name: sys.intern(f"faasr-vm-poll-{vm_action_name}")
+            for vm_action_name in self._vm_actions
         }
         
-        # Create VM stop action (unchanged)
-        self.workflow["ActionList"][vm_stop_name] = {
-            "FunctionName": "vm_stop",
-            "FaaSServer": github_server,
-            "Type": "Python",
-            "RequiresVM": False,
-            "InvokeNext": [],
-            "_faasr_builtin": True
-        }
+        # Check for name conflicts before modifying anything
+        self._check_name_conflicts([vm_start_name, vm_stop_name, *poll_action_names.values()])
         
-        # Find all VM-requiring actions and inject poll before each
-        vm_actions = []
-        for action_name, action_config in self.workflow["ActionList"].items():
-            if action_config.get("RequiresVM", False):
-                vm_actions.append(action_name)
+        template = self._builtin_action_template(github_server)
+        action_list = self.workflow["ActionList"]
         
-        logger.info(f"Found {len(vm_actions)} VM-requiring actions: {vm_actions}")
+        # Create VM start action (fire and forget)
+        action_list[vm_start_name] = dict(
+            template, FunctionName="vm_start", InvokeNext=[entry_action]
+        )
+        
+        # Create VM stop action (unchanged)
+        action_list[vm_stop_name] = dict(
+            template, FunctionName="vm_stop", InvokeNext=[]
+        )
+        self._action_names.update((vm_start_name, vm_stop_name))
+        self._index_action(vm_start_name)
+        self._index_action(vm_stop_name)
         
         # For each VM action, inject a poll action as its predecessor
-        for vm_action_name in vm_actions:
-            poll_action_name = f"faasr-vm-poll-{vm_action_name}"
-            
-            if poll_action_name in self.workflow["ActionList"]:
-                raise ValueError(f"Action name conflict: {poll_action_name} already exists")
+        index = self._graph_index
+        redirected = 0
+        poll_template = dict(template, FunctionName="vm_poll")
+        for vm_action_name in self._vm_actions:
+            poll_action_name = poll_action_names[vm_action_name]
             
             # Create poll action
-            self.workflow["ActionList"][poll_action_name] = {
-                "FunctionName": "vm_poll",
-                "FaaSServer": github_server,
-                "Type": "Python",
-                "RequiresVM": False,
-                "InvokeNext": [vm_action_name],
-                "_faasr_builtin": True
-            }
+            poll_action = poll_template.copy()
+            poll_action["InvokeNext"] = [vm_action_name]
+            action_list[poll_action_name] = poll_action
+            
+            self._action_names.add(poll_action_name)
             
             if container:
                 self.workflow["ActionContainers"][poll_action_name] = container
             
-            # Find all actions that invoke this VM action and redirect them to poll
-            for action_name, action_config in self.workflow["ActionList"].items():
-                if action_name == poll_action_name:
+            # Redirect every predecessor of the VM action to the poll action
+            vm_predecessors = predecessors.pop(vm_action_name, [])
+            for action_name in vm_predecessors:
+                successor_set = index["successor_sets"][action_name]
+                if vm_action_name not in successor_set:
                     continue
-                
-                invoke_next = action_config.get("InvokeNext", [])
-                
-                # Normalize invoke_next to a list for processing
-                if isinstance(invoke_next, str):
-                    invoke_next = [invoke_next]
-                
-                # Handle conditional InvokeNext (list containing dicts)
-                if isinstance(invoke_next, list) and len(invoke_next) > 0:
-                    modified = False
-                    new_invoke_next = []
-                    
-                    for item in invoke_next:
-                        if isinstance(item, dict):
-                            # This is a conditional dict like {"True": [...], "False": [...]}
-                            new_conditional = {}
-                            for condition, actions in item.items():
-                                if isinstance(actions, list):
-                                    # Replace vm_action with poll_action in the list
-                                    new_actions = [poll_action_name if x == vm_action_name else x for x in actions]
-                                    new_conditional[condition] = new_actions
-                                    if new_actions != actions:
-                                        modified = True
-                                else:
-                                    # Single action
-                                    new_action = poll_action_name if actions == vm_action_name else actions
-                                    new_conditional[condition] = new_action
-                                    if new_action != actions:
-                                        modified = True
-                            new_invoke_next.append(new_conditional)
-                        elif isinstance(item, str):
-                            # Simple string action
-                            if item == vm_action_name:
-                                new_invoke_next.append(poll_action_name)
-                                modified = True
-                            else:
-                                new_invoke_next.append(item)
-                        else:
-                            new_invoke_next.append(item)
-                    
-                    if modified:
-                        action_config["InvokeNext"] = new_invoke_next
-                        logger.info(f"Redirected '{action_name}' to invoke poll before '{vm_action_name}'")
-                
-                elif isinstance(invoke_next, dict):
-                    # Direct dict (not in a list) - rare case
-                    modified = False
-                    new_conditional = {}
-                    for condition, actions in invoke_next.items():
-                        if isinstance(actions, list):
-                            new_actions = [poll_action_name if x == vm_action_name else x for x in actions]
-                            new_conditional[condition] = new_actions
-                            if new_actions != actions:
-                                modified = True
-                        else:
-                            new_action = poll_action_name if actions == vm_action_name else actions
-                            new_conditional[condition] = new_action
-                            if new_action != actions:
-                                modified = True
-                    
-                    if modified:
-                        action_config["InvokeNext"] = new_conditional
-                        logger.info(f"Redirected '{action_name}' to invoke poll before '{vm_action_name}'")
+                action_config = action_list[action_name]
+                if self._redirect_invoke_next(action_config, vm_action_name, poll_action_name):
+                    _replace_in_place(index["successors"][action_name], vm_action_name, poll_action_name)
+                    successor_set.discard(vm_action_name)
+                    successor_set.add(poll_action_name)
+                    redirected += 1
+            
+            # Poll takes over the VM action's predecessors and becomes its only one
+            index["successors"][poll_action_name] = [vm_action_name]
+            index["successor_sets"][poll_action_name] = {vm_action_name}
+            predecessors[poll_action_name] = vm_predecessors
+            predecessors[vm_action_name] = [poll_action_name]
+            index["indegree"][poll_action_name] = index["indegree"].get(vm_action_name, 0)
+            index["indegree"][vm_action_name] = 1
+        logger.info(
+            "Injected %d poll action(s), redirecting %d predecessor(s)",
+            len(poll_action_names), redirected,
+        )
         
         # Modify leaf actions to point to stop
         for leaf_name in leaf_actions:
-            self.workflow["ActionList"][leaf_name]["InvokeNext"] = [vm_stop_name]
-            logger.info(f"Modified leaf '{leaf_name}' to invoke VM stop")
+            action_list[leaf_name]["InvokeNext"] = [vm_stop_name]
+            self._index_action(leaf_name)
+        logger.info("Redirected %d leaf action(s) to %s", len(leaf_actions), vm_stop_name)
         
         # Add containers for injected actions
         if "ActionContainers" not in self.workflow:
@@ -449,21 +678,53 @@ class VMInjectionTool:
         
         # Update FunctionInvoke to point to vm_start
         self.workflow["FunctionInvoke"] = vm_start_name
-        logger.info(f"Updated FunctionInvoke to: {vm_start_name}")
+        logger.info("Updated FunctionInvoke to: %s", vm_start_name)
         
         logger.info("VM actions injected successfully with parallel strategy")
     
     def save_workflow(self):
         """Save augmented workflow to output file."""
-        logger.info(f"Saving augmented workflow to: {self.output_path}")
+        logger.info("Saving augmented workflow to: %s", self.output_path)
+        
+        self._restore_invoke_next_format()
+        
+        # Write next to the target and rename so readers never see a partial file
+        tmp_path = self.output_path.with_suffix(self.output_path.suffix + ".tmp")
+        
+        # FAASR_COMPACT_OUTPUT skips pretty-printing (e.g. for CI artifacts)
+        compact = bool(os.environ.get("FAASR_COMPACT_OUTPUT"))
+        
+        # orjson only pretty-prints with a 2-space indent and raw UTF-8, so the
+        # indented output always goes through json to match the 4-space files
+        # CI writes; compact output is byte-identical either way
+        if compact and orjson:
+            data = memoryview(orjson.dumps(self.workflow, option=orjson.OPT_APPEND_NEWLINE))
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                while data:
+                    data = data[os.write(fd, data):]
+            finally:
+                os.close(fd)
+        else:
+            with open(tmp_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+                if compact:
+                    json.dump(self.workflow, f, separators=(",", ":"), ensure_ascii=False)
+                else:
+                    json.dump(self.workflow, f, indent=4)
+                f.write("\n")
         
-        with open(self.output_path, 'w') as f:
-            json.dump(self.workflow, f, indent=4)
+        os.replace(tmp_path, self.output_path)
         
         logger.info("Augmented workflow saved")
     
-    def run(self, strategy="parallel"): 
-        """Execute full injection process."""
+    def run(self, strategy="parallel", verbose=False):
+        """
+        Execute full injection process.
+        
+        Args:
+            strategy: VM orchestration strategy ("parallel" or "sequential")
+            verbose: Log the full traceback for unexpected errors
+        """
         try:
             self.load_workflow()
             
@@ -484,21 +745,28 @@ class VMInjectionTool:
             
             logger.info("=" * 60)
             logger.info("SUCCESS: Workflow augmented with VM orchestration")
-            logger.info(f"Strategy: {strategy}")
-            logger.info(f"Input:  {self.workflow_path}")
-            logger.info(f"Output: {self.output_path}")
+            logger.info("Strategy: %s", strategy)
+            logger.info("Input:  %s", self.workflow_path)
+            logger.info("Output: %s", self.output_path)
             logger.info("=" * 60)
             
             return True
             
+        except (ValueError, FileNotFoundError) as e:
+            # Expected validation failures - the message says it all
+            logger.error("Failed to inject VM actions: %s", e)
+            return False
+            
         except Exception as e:
-            logger.error(f"Failed to inject VM actions: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.error("Failed to inject VM actions: %s", e)
+            if verbose:
+                import traceback
+                logger.error(traceback.format_exc())
             return False
 
 
-def main():
+def _build_parser():
+    """Build the command line parser."""
     parser = argparse.ArgumentParser(
         description="Inject VM orchestration actions into FaaSr workflows"
     )
@@ -517,18 +785,41 @@ def main():
         choices=["sequential", "parallel"],
         help="VM orchestration strategy: 'sequential' blocks until VM ready (simple), 'parallel' polls per VM action (efficient, default)"
     )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Log full tracebacks for unexpected errors"
+    )
+    return parser
+
+
+_PARSER = _build_parser()
+
+
+def main():
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(levelname)s: %(message)s",
+        stream=sys.stdout
+    )
     
-    args = parser.parse_args()
+    args = _PARSER.parse_args()
 
     if os.getenv("GITHUB_ACTIONS") == "true":
         logger.info("Running in GitHub Actions environment")
     
     tool = VMInjectionTool(args.input, args.output)
-    success = tool.run(strategy=args.strategy)
+    success = tool.run(strategy=args.strategy, verbose=args.verbose)
 
     if os.getenv("GITHUB_ACTIONS") == "true":
         output_file = tool.output_path
-        print(f"::set-output name=augmented_file::{output_file}")
+        github_output = os.getenv("GITHUB_OUTPUT")
+        if github_output:
+            with open(github_output, "a") as f:
+                f.write(f"augmented_file={output_file}\n")
+        else:
+            # Older runners without the GITHUB_OUTPUT file
+            print(f"::set-output name=augmented_file::{output_file}")
     
     sys.exit(0 if success else 1)
 
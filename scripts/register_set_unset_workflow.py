@@ -1,21 +1,33 @@
 #!/usr/bin/env python3
 
 import argparse
+import functools
 import json
 import logging
 import os
+import re
 import subprocess
 import sys
-import textwrap
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import boto3
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from FaaSr_py import graph_functions as faasr_gf
-from github import Github
+from github import Github, InputGitTreeElement
 from croniter import croniter
 from datetime import datetime
 
+from _workflow_cache import load_cached_workflow, store_cached_workflow, workflow_cache_path
+
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib parser
+    orjson = None
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(levelname)s: %(message)s",
@@ -24,6 +36,59 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Platform being deployed by the current thread, used to tag its log lines
+_deploy_context = threading.local()
+
+
+class _PlatformLogFilter(logging.Filter):
+    """Prefix messages logged from a platform's deploy threads with its name"""
+
+    def filter(self, record):
+        platform = getattr(_deploy_context, "platform", None)
+        if platform:
+            record.msg = f"[{platform}] {record.msg}"
+        return True
+
+
+logger.addFilter(_PlatformLogFilter())
+
+
+def _set_deploy_platform(platform):
+    _deploy_context.platform = platform
+
+
+def _platform_executor(max_workers):
+    """Thread pool whose workers log under the calling thread's platform"""
+    return ThreadPoolExecutor(
+        max_workers=max_workers,
+        initializer=_set_deploy_platform,
+        initargs=(getattr(_deploy_context, "platform", None),),
+    )
+
+
+def _deploy_platform(faas_type, deployer, workflow_data, actions):
+    """Run one platform's deployer, tagging the log lines it produces"""
+    _set_deploy_platform(faas_type)
+    try:
+        deployer(workflow_data, actions)
+    finally:
+        _set_deploy_platform(None)
+
+# Shared HTTP session so repeated requests to a host reuse connections
+_HTTP = requests.Session()
+for _scheme in ("http://", "https://"):
+    _HTTP.mount(
+        _scheme,
+        HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=Retry(total=1, backoff_factor=0.1)),
+    )
+
+# Containers that can be used without enabling custom containers
+try:
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "native_containers.txt"), "r") as f:
+        _NATIVE_CONTAINERS = frozenset(line.strip() for line in f)
+except FileNotFoundError:
+    _NATIVE_CONTAINERS = None
+
 
 def parse_arguments():
     parser = argparse.ArgumentParser(
@@ -57,14 +122,31 @@ def parse_arguments():
     return args
 
 
+# Five whitespace-separated fields; anything else is rejected without croniter
+_CRON_RE = re.compile(r'^\s*\S+\s+\S+\s+\S+\s+\S+\s+\S+\s*$')
+
+
+@functools.lru_cache(maxsize=128)
+def _next_cron_run(cron_expr, start):
+    """Next run of a cron expression after start (cached per expression and minute)"""
+    return croniter(cron_expr, start).get_next(datetime)
+
+
 def validate_cron_expression(cron_expr):
     """Validate cron expression syntax"""
     if not cron_expr:
         return True  # Optional parameter
     
     try:
-        iter = croniter(cron_expr, datetime.now())
-        next_run = iter.get_next(datetime)
+        if not _CRON_RE.match(cron_expr):
+            raise ValueError("expected 5 fields: minute hour day month weekday")
+        
+        if not logger.isEnabledFor(logging.INFO):
+            croniter(cron_expr)  # Parse only; the next run is just for the log
+            return True
+        
+        # Cron has minute resolution, so truncating keeps the result the same
+        next_run = _next_cron_run(cron_expr, datetime.now().replace(second=0, microsecond=0))
         
         logger.info(f"Cron expression validated: {cron_expr}")
         logger.info(f"Next scheduled run: {next_run.strftime('%Y-%m-%d %H:%M:%S')}")
@@ -86,9 +168,19 @@ def validate_cron_expression(cron_expr):
 
 
 def read_workflow_file(file_path):
+    """Read a workflow JSON file, reusing a cached parse if the file is unchanged"""
     try:
-        with open(file_path, "r") as f:
-            return json.load(f)
+        path = os.path.abspath(file_path)
+        st = os.stat(path)
+        cache_path = workflow_cache_path(path, st)
+        data = load_cached_workflow(cache_path)
+        if data is None:
+            with open(path, "rb") as f:
+                buf = f.read()
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            data = orjson.loads(buf) if orjson else json.loads(buf)
+            store_cached_workflow(cache_path, data)
+        return data
     except FileNotFoundError:
         logger.error(f"Error: Workflow file {file_path} not found")
         sys.exit(1)
@@ -97,6 +189,15 @@ def read_workflow_file(file_path):
         sys.exit(1)
 
 
+def check_action_containers(workflow_data):
+    """Check that every action has a container image before deploying anything"""
+    action_containers = workflow_data.get("ActionContainers", {})
+    missing = [name for name in workflow_data["ActionList"] if not action_containers.get(name)]
+    if missing:
+        logger.error(f"No container specified for action(s): {', '.join(missing)}")
+        sys.exit(1)
+
+
 def verify_containers(workflow_data):
     """Check if custom containers are specified via environment variable"""
     custom_container = os.getenv("CUSTOM_CONTAINER", "false").lower() == "true"
@@ -105,127 +206,107 @@ def verify_containers(workflow_data):
         logger.info("Using custom containers")
         return
 
-    # Get set of native containers
-    with open("scripts/native_containers.txt", "r") as f:
-        native_containers = {line.strip() for line in f.readlines()}
+    if _NATIVE_CONTAINERS is None:
+        logger.error("native_containers.txt not found next to this script")
+        sys.exit(1)
 
-    for container in workflow_data.get("ActionContainers", {}).values():
-        if container not in native_containers:
+    custom_containers = set(workflow_data.get("ActionContainers", {}).values()) - _NATIVE_CONTAINERS
+    if custom_containers:
+        for container in sorted(custom_containers):
             logger.error(
                 f"Custom container {container} not in native_containers.txt -- to use it, you must enable custom containers"
             )
-            sys.exit(1)
+        sys.exit(1)
+
+
+# Secret name suffixes imported for each compute server FaaSType
+_COMPUTE_SERVER_SECRETS = {
+    "GitHubActions": ("_PAT",),
+    "Lambda": ("_AccessKey", "_SecretKey"),
+    "OpenWhisk": ("_APIkey",),
+    "GoogleCloud": ("_SecretKey",),
+    "SLURM": ("_Token",),
+}
+
+# Secret name suffixes imported for each data store and AWS VM
+_ACCESS_KEY_SECRETS = ("_AccessKey", "_SecretKey")
 
 
 def generate_github_secret_imports(faasr_payload):
     """Generate GitHub Actions secret import commands from FaaSr payload."""
-    import_statements = []
+    # Each line is indented to sit under the job's env: key
+    indent = " " * 12
+    secret_names = []
 
     # Add secrets for compute servers
     for faas_name, compute_server in faasr_payload.get("ComputeServers", {}).items():
         faas_type = compute_server.get("FaaSType", "")
-        match (faas_type):
-            case "GitHubActions":
-                pat_secret = f"{faas_name}_PAT"
-                import_statements.append(
-                    f"{pat_secret}: ${{{{ secrets.{pat_secret}}}}}"
-                )
-            case "Lambda":
-                access_key = f"{faas_name}_AccessKey"
-                secret_key = f"{faas_name}_SecretKey"
-                import_statements.extend(
-                    [
-                        f"{access_key}: ${{{{ secrets.{access_key}}}}}",
-                        f"{secret_key}: ${{{{ secrets.{secret_key}}}}}",
-                    ]
-                )
-            case "OpenWhisk":
-                api_key = f"{faas_name}_APIkey"
-                import_statements.append(f"{api_key}: ${{{{ secrets.{api_key}}}}}")
-            case "GoogleCloud":
-                secret_key = f"{faas_name}_SecretKey"
-                import_statements.append(
-                    f"{secret_key}: ${{{{ secrets.{secret_key}}}}}"
-                )
-            case "SLURM":
-                token = f"{faas_name}_Token"
-                import_statements.append(f"{token}: ${{{{ secrets.{token}}}}}")
-            case _:
-                logger.error(
-                    f"Unknown FaaSType ({faas_type}) for compute server: {faas_name} - cannot generate secrets"
-                )
-                sys.exit(1)
+        suffixes = _COMPUTE_SERVER_SECRETS.get(faas_type)
+        if suffixes is None:
+            logger.error(
+                f"Unknown FaaSType ({faas_type}) for compute server: {faas_name} - cannot generate secrets"
+            )
+            sys.exit(1)
+        secret_names.extend(f"{faas_name}{suffix}" for suffix in suffixes)
 
     # Add secrets for data stores
-    for s3_name in faasr_payload.get("DataStores", {}).keys():
-        secret_key = f"{s3_name}_SecretKey"
-        access_key = f"{s3_name}_AccessKey"
-        import_statements.extend(
-            [
-                f"{access_key}: ${{{{ secrets.{access_key}}}}}",
-                f"{secret_key}: ${{{{ secrets.{secret_key}}}}}",
-            ]
-        )
+    for s3_name in faasr_payload.get("DataStores", {}):
+        secret_names.extend(f"{s3_name}{suffix}" for suffix in _ACCESS_KEY_SECRETS)
 
     if "VMConfig" in faasr_payload:
         vm_config = faasr_payload["VMConfig"]
         vm_name = vm_config.get("Name")
 
-        if vm_name:
-            provider = vm_config.get("Provider", "AWS")
-
-            if provider == "AWS":
-                access_key = f"{vm_name}_AccessKey"
-                secret_key = f"{vm_name}_SecretKey"
-                import_statements.extend(
-                    [
-                        f"{access_key}: ${{{{ secrets.{access_key}}}}}",
-                        f"{secret_key}: ${{{{ secrets.{secret_key}}}}}",
-                    ]
-                )
+        if vm_name and vm_config.get("Provider", "AWS") == "AWS":
+            secret_names.extend(f"{vm_name}{suffix}" for suffix in _ACCESS_KEY_SECRETS)
 
-    # Indent each line for YAML formatting
-    indent = " " * 20
-    import_statements = "\n".join(f"{indent}{s}" for s in import_statements)
+    return "\n".join(f"{indent}{name}: ${{{{ secrets.{name}}}}}" for name in secret_names)
 
-    return import_statements
 
+# Workflow YAML for one action, after its "name:" line; the "on" section and
+# dispatch env lines depend on whether the action runs on a schedule
+_ACTION_YAML_TEMPLATE = """\
+%(on_section)s
 
-def generate_serverless_yaml(action_name, container_image, secret_imports, cron_schedule=None, payload_url=None):
-    """
-    Generate YAML for serverless (GitHub-hosted runner)
-    
-    Args:
-        action_name: Name of the action
-        container_image: Docker container image
-        secret_imports: Secret import statements
-        cron_schedule: Optional cron schedule string (None to not include schedule)
-        payload_url: Optional default payload URL for scheduled runs
-    """
-    
-    # Build 'on' section based on whether schedule is requested
-    if cron_schedule:
-        # WITH SCHEDULE - Include schedule section and default values
-        on_section = f"""on:
+jobs:
+    %(job_name)s:
+        runs-on: %(runs_on)s
+        container: %(container_image)s
+
+        env:
+%(secret_imports)s
+%(dispatch_env)s
+
+        steps:
+          - name: Run Python entrypoint
+            run: |
+                cd /action
+                python3 faasr_entry.py
+"""
+
+# WITH SCHEDULE - Include schedule section and default values
+_ON_SECTION_SCHED = """\
+on:
   schedule:
-    - cron: '{cron_schedule}'
+    - cron: '%(cron_schedule)s'
   workflow_dispatch:
     inputs:
       OVERWRITTEN:
         description: "Overwritten fields"
         required: false
-        default: '{{}}'
+        default: '{}'
       PAYLOAD_URL:
         description: "URL to payload"
         required: false
-        default: {payload_url}"""
-        
-        # Add default values to env vars for scheduled runs
-        overwritten_env = '                    OVERWRITTEN: ${{ github.event.inputs.OVERWRITTEN || \'{}\' }}'
-        payload_url_env = f'                    PAYLOAD_URL: ${{{{ github.event.inputs.PAYLOAD_URL || \'{payload_url}\' }}}}'
-    else:
-        # WITHOUT SCHEDULE - Regular registration, inputs are required
-        on_section = """on:
+        default: %(payload_url)s"""
+
+_DISPATCH_ENV_SCHED = """\
+            OVERWRITTEN: ${{ github.event.inputs.OVERWRITTEN || '{}' }}
+            PAYLOAD_URL: ${{ github.event.inputs.PAYLOAD_URL || '%(payload_url)s' }}"""
+
+# WITHOUT SCHEDULE - Regular registration, inputs are required
+_ON_SECTION_NOSCHED = """\
+on:
   workflow_dispatch:
     inputs:
       OVERWRITTEN:
@@ -234,33 +315,72 @@ def generate_serverless_yaml(action_name, container_image, secret_imports, cron_
       PAYLOAD_URL:
         description: "URL to payload"
         required: true"""
-        
-        # No default values needed for manual-only workflows
-        overwritten_env = '                    OVERWRITTEN: ${{ github.event.inputs.OVERWRITTEN }}'
-        payload_url_env = '                    PAYLOAD_URL: ${{ github.event.inputs.PAYLOAD_URL }}'
+
+_DISPATCH_ENV_NOSCHED = """\
+            OVERWRITTEN: ${{ github.event.inputs.OVERWRITTEN }}
+            PAYLOAD_URL: ${{ github.event.inputs.PAYLOAD_URL }}"""
+
+
+def _build_on_section(cron_schedule=None, payload_url=None):
+    """
+    Build the 'on' section and dispatch env lines for an action workflow
+
+    Args:
+        cron_schedule: Optional cron schedule string (None to not include schedule)
+        payload_url: Optional default payload URL for scheduled runs
+
+    Returns:
+        tuple: (on_section, dispatch_env)
+    """
+    if cron_schedule:
+        values = {"cron_schedule": cron_schedule, "payload_url": payload_url}
+        return _ON_SECTION_SCHED % values, _DISPATCH_ENV_SCHED % values
+    return _ON_SECTION_NOSCHED, _DISPATCH_ENV_NOSCHED
+
+
+@functools.lru_cache(maxsize=None)
+def _render_action_body(job_name, runs_on, container_image, secret_imports,
+                        cron_schedule=None, payload_url=None):
+    """
+    Fill in _ACTION_YAML_TEMPLATE
+
+    Only the name line differs between actions that share a container,
+    runner and schedule, so the rest is rendered once per combination.
+    """
+    on_section, dispatch_env = _build_on_section(cron_schedule, payload_url)
+    return _ACTION_YAML_TEMPLATE % {
+        "on_section": on_section,
+        "job_name": job_name,
+        "runs_on": runs_on,
+        "container_image": container_image,
+        "secret_imports": secret_imports,
+        "dispatch_env": dispatch_env,
+    }
+
+
+def _render_action_yaml(job_name, runs_on, action_name, container_image, secret_imports,
+                        cron_schedule=None, payload_url=None):
+    """Workflow YAML for one action"""
+    body = _render_action_body(
+        job_name, runs_on, container_image, secret_imports, cron_schedule, payload_url
+    )
+    return f"name: {action_name}\n\n{body}"
+
+
+def generate_serverless_yaml(action_name, container_image, secret_imports, cron_schedule=None, payload_url=None):
+    """
+    Generate YAML for serverless (GitHub-hosted runner)
     
-    return textwrap.dedent(
-        f"""\
-        name: {action_name}
-
-        {on_section}
-
-        jobs:
-            run_docker_image:
-                runs-on: ubuntu-latest
-                container: {container_image}
-
-                env:
-{secret_imports}
-{overwritten_env}
-{payload_url_env}
-
-                steps:
-                  - name: Run Python entrypoint
-                    run: |
-                        cd /action
-                        python3 faasr_entry.py
+    Args:
+        action_name: Name of the action
+        container_image: Docker container image
+        secret_imports: Secret import statements
+        cron_schedule: Optional cron schedule string (None to not include schedule)
+        payload_url: Optional default payload URL for scheduled runs
     """
+    return _render_action_yaml(
+        "run_docker_image", "ubuntu-latest", action_name, container_image, secret_imports,
+        cron_schedule, payload_url
     )
 
 
@@ -275,74 +395,95 @@ def generate_vm_yaml(action_name, container_image, secret_imports, cron_schedule
         cron_schedule: Optional cron schedule string (None to not include schedule)
         payload_url: Optional default payload URL for scheduled runs
     """
-    
-    # Build 'on' section based on whether schedule is requested
-    if cron_schedule:
-        # WITH SCHEDULE - Include schedule section and default values
-        on_section = f"""on:
-  schedule:
-    - cron: '{cron_schedule}'
-  workflow_dispatch:
-    inputs:
-      OVERWRITTEN:
-        description: "Overwritten fields"
-        required: false
-        default: '{{}}'
-      PAYLOAD_URL:
-        description: "URL to payload"
-        required: false
-        default: {payload_url}"""
-        
-        # Add default values to env vars for scheduled runs
-        overwritten_env = '                    OVERWRITTEN: ${{ github.event.inputs.OVERWRITTEN || \'{}\' }}'
-        payload_url_env = f'                    PAYLOAD_URL: ${{{{ github.event.inputs.PAYLOAD_URL || \'{payload_url}\' }}}}'
-    else:
-        # WITHOUT SCHEDULE - Regular registration, inputs are required
-        on_section = """on:
-  workflow_dispatch:
-    inputs:
-      OVERWRITTEN:
-        description: "Overwritten fields"
-        required: true
-      PAYLOAD_URL:
-        description: "URL to payload"
-        required: true"""
-        
-        # No default values needed for manual-only workflows
-        overwritten_env = '                    OVERWRITTEN: ${{ github.event.inputs.OVERWRITTEN }}'
-        payload_url_env = '                    PAYLOAD_URL: ${{ github.event.inputs.PAYLOAD_URL }}'
-    
-    return textwrap.dedent(
-        f"""\
-        name: {action_name}
-
-        {on_section}
-
-        jobs:
-            run_on_vm:
-                runs-on: self-hosted
-                container: {container_image}
-
-                env:
-{secret_imports}
-{overwritten_env}
-{payload_url_env}
-
-                steps:
-                  - name: Run Python entrypoint
-                    run: |
-                        cd /action
-                        python3 faasr_entry.py
+    return _render_action_yaml(
+        "run_on_vm", "self-hosted", action_name, container_image, secret_imports,
+        cron_schedule, payload_url
+    )
+
+
+def _bucket_actions_by_faastype(workflow_data):
+    """
+    Group actions by the lowercased FaaSType of their compute server
+
+    Args:
+        workflow_data: Workflow JSON data
+
+    Returns:
+        dict: faas_type -> {action_name: action_data}, in ActionList order
+    """
+    server_types = {}
+    buckets = {}
+    for action_name, action_data in workflow_data["ActionList"].items():
+        server_name = action_data["FaaSServer"]
+        faas_type = server_types.get(server_name)
+        if faas_type is None:
+            faas_type = server_types[server_name] = (
+                workflow_data["ComputeServers"][server_name]["FaaSType"].lower()
+            )
+        buckets.setdefault(faas_type, {})[action_name] = action_data
+    return buckets
+
+
+def _commit_workflow_files(repo, branch, workflow_files, existing_files, workflow_name):
     """
+    Write workflow files to the repository in a single commit
+
+    Blobs are uploaded concurrently, then one tree and commit are created
+    and the branch is moved to it. Concurrent Contents API writes would
+    race on the branch head, so only the uploads run in parallel.
+
+    Args:
+        repo: PyGithub repository
+        branch: Branch to commit to
+        workflow_files: dict of file path -> YAML content
+        existing_files: dict of file path -> blob sha for files already on the branch
+        workflow_name: Workflow name used in the commit message
+    """
+    blob_shas = {}
+    with _platform_executor(8) as executor:
+        futures = {
+            executor.submit(repo.create_git_blob, content, "utf-8"): path
+            for path, content in workflow_files.items()
+        }
+        try:
+            for future in as_completed(futures):
+                blob_shas[futures[future]] = future.result().sha
+        except Exception:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    # Blob shas match the Contents API shas, so unchanged files drop out here
+    changed = [path for path in workflow_files if blob_shas[path] != existing_files.get(path)]
+    if not changed:
+        logger.info("All workflow files are up to date")
+        return
+
+    ref = repo.get_git_ref(f"heads/{branch}")
+    base_commit = repo.get_git_commit(ref.object.sha)
+    tree = repo.create_git_tree(
+        [InputGitTreeElement(path, "100644", "blob", sha=blob_shas[path]) for path in changed],
+        base_commit.tree,
     )
+    commit = repo.create_git_commit(
+        f"Register workflow: {workflow_name} ({len(changed)} file(s))", tree, [base_commit]
+    )
+    ref.edit(commit.sha)
+
+    for path in changed:
+        prefixed_action_name = os.path.splitext(os.path.basename(path))[0]
+        if path in existing_files:
+            logger.info(f"Updated workflow: {prefixed_action_name}")
+        else:
+            logger.info(f"Created workflow: {prefixed_action_name}")
 
 
-def deploy_to_github(workflow_data, cron_schedule=None, payload_url=None, entry_action=None):
+def deploy_to_github(workflow_data, github_actions, cron_schedule=None, payload_url=None, entry_action=None):
     """
     Deploys GH functions to GitHub Actions
     
     Args:
         workflow_data: Workflow JSON data
+        github_actions: Actions to deploy to GitHub Actions (name -> action data)
         cron_schedule: Optional cron schedule for entry action
         payload_url: Optional payload URL for scheduled runs
         entry_action: Name of the entry action (only this gets the schedule)
@@ -368,15 +509,6 @@ def deploy_to_github(workflow_data, cron_schedule=None, payload_url=None, entry_
     # Get the current repository
     repo_name = os.getenv("GITHUB_REPOSITORY")
 
-    # Filter actions to be deployed to GitHub Actions
-    github_actions = {}
-    for action_name, action_data in workflow_data["ActionList"].items():
-        server_name = action_data["FaaSServer"]
-        server_config = workflow_data["ComputeServers"][server_name]
-        faas_type = server_config["FaaSType"].lower()
-        if faas_type == "githubactions":
-            github_actions[action_name] = action_data
-
     if not github_actions:
         logger.info("No actions found for GitHub Actions deployment")
         return
@@ -388,7 +520,22 @@ def deploy_to_github(workflow_data, cron_schedule=None, payload_url=None, entry_
         default_branch = repo.default_branch
         logger.info(f"Using branch: {default_branch}")
 
-        # Deploy each action
+        # List existing workflow files once instead of probing each one
+        try:
+            existing_files = {
+                content.path: content.sha
+                for content in repo.get_contents(".github/workflows", ref=default_branch)
+            }
+        except Exception:
+            # No workflows directory yet
+            existing_files = {}
+
+        # Secrets depend only on the servers, data stores and VM config,
+        # so they are the same for every action
+        secret_imports = generate_github_secret_imports(workflow_data)
+
+        # Generate each action's workflow file
+        workflow_files = {}
         for action_name, action_data in github_actions.items():
             # Create prefixed action name using workflow_name-action_name format
             prefixed_action_name = f"{json_prefix}-{action_name}"
@@ -396,16 +543,8 @@ def deploy_to_github(workflow_data, cron_schedule=None, payload_url=None, entry_
             requires_vm = action_data.get("RequiresVM", False)
 
             # Create workflow file
-            # Get container image, with fallback to default
-            container_image = workflow_data.get("ActionContainers", {}).get(action_name)
-
-            # Ensure container image is specified
-            if not container_image:
-                logger.error(f"No container specified for action: {action_name}")
-                sys.exit(1)
-
-            # Dynamically set required secrets and variables
-            secret_imports = generate_github_secret_imports(workflow_data)
+            # Container presence was checked by check_action_containers
+            container_image = workflow_data["ActionContainers"][action_name]
 
             # Determine if this action should get the timer
             # Only the entry action gets the schedule
@@ -430,28 +569,10 @@ def deploy_to_github(workflow_data, cron_schedule=None, payload_url=None, entry_
                     payload_url=action_payload_url
                 )
 
-            # Create or update the workflow file
-            workflow_file = f".github/workflows/{prefixed_action_name}.yml"
-            try:
-                # Try to get the existing file
-                existing_file = repo.get_contents(workflow_file, ref=default_branch)
-                repo.update_file(
-                    workflow_file,
-                    f"Update workflow: {prefixed_action_name}",
-                    workflow_content,
-                    existing_file.sha,
-                    branch=default_branch,
-                )
-                logger.info(f"Updated workflow: {prefixed_action_name}")
-            except Exception:
-                # File does not exist, create it
-                repo.create_file(
-                    workflow_file,
-                    f"Create workflow: {prefixed_action_name}",
-                    workflow_content,
-                    branch=default_branch,
-                )
-                logger.info(f"Created workflow: {prefixed_action_name}")
+            workflow_files[f".github/workflows/{prefixed_action_name}.yml"] = workflow_content
+
+        # Create or update all workflow files
+        _commit_workflow_files(repo, default_branch, workflow_files, existing_files, workflow_name)
 
         logger.info("GitHub Actions deployment completed successfully")
 
@@ -460,8 +581,38 @@ def deploy_to_github(workflow_data, cron_schedule=None, payload_url=None, entry_
         sys.exit(1)
 
 
-def deploy_to_aws(workflow_data):
-    """Deploys functions to AWS Lambda"""
+def _deploy_lambda_function(lambda_client, function_name, container_image, role_arn):
+    """
+    Create a Lambda function, or update its code if it already exists
+
+    Returns:
+        str: "Created" or "Updated"
+    """
+    logger.info(f"Deploying Lambda function: {function_name}")
+
+    # Check if function exists first: updating needs no role, so this keeps
+    # working when AWS_ARN is not configured
+    try:
+        lambda_client.get_function(FunctionName=function_name)
+    except lambda_client.exceptions.ResourceNotFoundException:
+        lambda_client.create_function(
+            FunctionName=function_name,
+            Role=role_arn,
+            Code={"ImageUri": container_image},
+            PackageType="Image",
+            Timeout=900,  # 15 minutes
+            MemorySize=3008,
+        )
+        return "Created"
+
+    lambda_client.update_function_code(
+        FunctionName=function_name, ImageUri=container_image
+    )
+    return "Updated"
+
+
+def deploy_to_aws(workflow_data, lambda_actions):
+    """Deploys the given actions (name -> action data) to AWS Lambda"""
     logger.info("Deploying to AWS Lambda...")
 
     # Get AWS credentials from environment
@@ -475,23 +626,13 @@ def deploy_to_aws(workflow_data):
         )
         sys.exit(1)
 
-    # Filter actions to be deployed to Lambda
-    lambda_actions = {}
-    for action_name, action_data in workflow_data["ActionList"].items():
-        server_name = action_data["FaaSServer"]
-        server_config = workflow_data["ComputeServers"][server_name]
-        faas_type = server_config["FaaSType"].lower()
-        if faas_type == "lambda":
-            lambda_actions[action_name] = action_data
-
     if not lambda_actions:
         logger.info("No actions found for Lambda deployment")
         return
 
     # Create Lambda client
-    region = workflow_data["ComputeServers"][
-        lambda_actions[list(lambda_actions.keys())[0]]["FaaSServer"]
-    ].get("Region", "us-east-1")
+    first_action = next(iter(lambda_actions.values()))
+    region = workflow_data["ComputeServers"][first_action["FaaSServer"]].get("Region", "us-east-1")
 
     lambda_client = boto3.client(
         "lambda",
@@ -500,73 +641,70 @@ def deploy_to_aws(workflow_data):
         region_name=region,
     )
 
-    # Deploy each action
-    for action_name, action_data in lambda_actions.items():
-        logger.info(f"Deploying Lambda function: {action_name}")
-
-        # Get container image
-        container_image = workflow_data.get("ActionContainers", {}).get(action_name)
-
-        if not container_image:
-            logger.error(f"No container specified for action: {action_name}")
-            sys.exit(1)
+    # Check every container URI before deploying anything
+    deployments = {}
+    for action_name in lambda_actions:
+        container_image = workflow_data["ActionContainers"][action_name]
 
-        # Parse ECR URI for account ID
-        if container_image.startswith("public.ecr.aws"):
-            # Public ECR format: public.ecr.aws/registry_alias/repository:tag
-            account_id = None  # Public repos don't need account ID in role ARN
-        elif ".dkr.ecr." in container_image:
-            # Private ECR format: account-id.dkr.ecr.region.amazonaws.com/repo:tag
-            account_id = container_image.split(".")[0]
-        else:
+        # Public ECR (public.ecr.aws/registry_alias/repository:tag) or
+        # private ECR (account-id.dkr.ecr.region.amazonaws.com/repo:tag)
+        if not (container_image.startswith("public.ecr.aws") or ".dkr.ecr." in container_image):
             logger.error(
                 f"Unsupported container URI format for {action_name}: {container_image}"
             )
             sys.exit(1)
 
         function_name = f"{workflow_data.get('WorkflowName', 'faasr')}-{action_name}"
-
-        role_arn = aws_arn
-
-        # Check if function exists
-        function_exists = False
-        try:
-            lambda_client.get_function(FunctionName=function_name)
-            function_exists = True
-        except lambda_client.exceptions.ResourceNotFoundException:
-            pass
-
-        if function_exists:
-            # Update existing function
+        deployments[function_name] = container_image
+
+    # Deploy the functions concurrently; boto3 clients are thread-safe
+    failed = False
+    with _platform_executor(10) as executor:
+        futures = {
+            executor.submit(
+                _deploy_lambda_function, lambda_client, function_name, container_image, aws_arn
+            ): function_name
+            for function_name, container_image in deployments.items()
+        }
+        for future in as_completed(futures):
+            function_name = futures[future]
             try:
-                lambda_client.update_function_code(
-                    FunctionName=function_name, ImageUri=container_image
-                )
-                logger.info(f"Updated Lambda function: {function_name}")
-            except Exception as e:
-                logger.error(f"Failed to update Lambda function {function_name}: {e}")
-                sys.exit(1)
-        else:
-            # Create new function
-            try:
-                lambda_client.create_function(
-                    FunctionName=function_name,
-                    Role=role_arn,
-                    Code={"ImageUri": container_image},
-                    PackageType="Image",
-                    Timeout=900,  # 15 minutes
-                    MemorySize=3008,
-                )
-                logger.info(f"Created Lambda function: {function_name}")
+                logger.info(f"{future.result()} Lambda function: {function_name}")
             except Exception as e:
-                logger.error(f"Failed to create Lambda function {function_name}: {e}")
-                sys.exit(1)
+                logger.error(f"Failed to deploy Lambda function {function_name}: {e}")
+                failed = True
+
+    if failed:
+        sys.exit(1)
 
     logger.info("AWS Lambda deployment completed successfully")
 
 
-def deploy_to_ow(workflow_data):
-    """Deploys functions to OpenWhisk"""
+def _deploy_ow_action(actions_url, action_name, container_image, auth, verify):
+    """Create or update an OpenWhisk docker action through the REST API"""
+    logger.info(f"Deploying OpenWhisk action: {action_name}")
+    response = _HTTP.put(
+        f"{actions_url}/{action_name}",
+        params={"overwrite": "true"},
+        json={
+            "exec": {"kind": "blackbox", "image": container_image},
+            # Same annotations as `wsk action update --web true`
+            "annotations": [
+                {"key": "web-export", "value": True},
+                {"key": "raw-http", "value": False},
+                {"key": "final", "value": True},
+            ],
+        },
+        auth=auth,
+        verify=verify,
+        timeout=60,
+    )
+    if not response.ok:
+        raise RuntimeError(f"HTTP {response.status_code} - {response.text[:200]}")
+
+
+def deploy_to_ow(workflow_data, ow_actions):
+    """Deploys the given actions (name -> action data) to OpenWhisk"""
     logger.info("Deploying to OpenWhisk...")
 
     ow_api_key = os.getenv("OW_APIkey")
@@ -577,21 +715,12 @@ def deploy_to_ow(workflow_data):
         )
         sys.exit(1)
 
-    # Filter actions to be deployed to OpenWhisk
-    ow_actions = {}
-    for action_name, action_data in workflow_data["ActionList"].items():
-        server_name = action_data["FaaSServer"]
-        server_config = workflow_data["ComputeServers"][server_name]
-        faas_type = server_config["FaaSType"].lower()
-        if faas_type == "openwhisk":
-            ow_actions[action_name] = action_data
-
     if not ow_actions:
         logger.info("No actions found for OpenWhisk deployment")
         return
 
     # Get OpenWhisk configuration from first action's server
-    first_action = list(ow_actions.values())[0]
+    first_action = next(iter(ow_actions.values()))
     server_name = first_action["FaaSServer"]
     server_config = workflow_data["ComputeServers"][server_name]
 
@@ -603,47 +732,42 @@ def deploy_to_ow(workflow_data):
         logger.error("OpenWhisk API.host not specified in workflow configuration")
         sys.exit(1)
 
-    # Configure wsk CLI
-    insecure_flag = "--insecure" if server_config.get("Insecure", False) else ""
-
-    # Set up wsk CLI with credentials
-    wsk_config_cmd = f"wsk property set --apihost {api_host} --auth {ow_api_key} --namespace {namespace} {insecure_flag}"
-    result = subprocess.run(wsk_config_cmd, shell=True, capture_output=True, text=True)
+    # Talk to the OpenWhisk REST API directly instead of shelling out to wsk
+    if not api_host.startswith("http"):
+        api_host = f"https://{api_host}"
+    actions_url = f"{api_host}/api/v1/namespaces/{namespace}/actions"
+    auth = tuple(ow_api_key.split(":", 1))
+    verify = not server_config.get("Insecure", False)
+
+    action_containers = workflow_data["ActionContainers"]
+    deployments = {action_name: action_containers[action_name] for action_name in ow_actions}
+
+    # Deploy the actions concurrently
+    failed = False
+    with _platform_executor(10) as executor:
+        futures = {
+            executor.submit(
+                _deploy_ow_action, actions_url, action_name, container_image, auth, verify
+            ): action_name
+            for action_name, container_image in deployments.items()
+        }
+        for future in as_completed(futures):
+            action_name = futures[future]
+            try:
+                future.result()
+                logger.info(f"Deployed OpenWhisk action: {action_name}")
+            except Exception as e:
+                logger.error(f"Failed to deploy OpenWhisk action {action_name}: {e}")
+                failed = True
 
-    if result.returncode != 0:
-        logger.error(f"Failed to configure OpenWhisk CLI: {result.stderr}")
+    if failed:
         sys.exit(1)
 
-    logger.info(f"Configured OpenWhisk CLI for {api_host}")
-
-    # Deploy each action
-    for action_name, action_data in ow_actions.items():
-        logger.info(f"Deploying OpenWhisk action: {action_name}")
-
-        # Get container image
-        container_image = workflow_data.get("ActionContainers", {}).get(action_name)
-
-        if not container_image:
-            logger.error(f"No container specified for action: {action_name}")
-            sys.exit(1)
-
-        # Create or update the action
-        action_cmd = f"wsk action update {action_name} --docker {container_image} --web true {insecure_flag}"
-        result = subprocess.run(action_cmd, shell=True, capture_output=True, text=True)
-
-        if result.returncode != 0:
-            logger.error(
-                f"Failed to deploy OpenWhisk action {action_name}: {result.stderr}"
-            )
-            sys.exit(1)
-
-        logger.info(f"Deployed OpenWhisk action: {action_name}")
-
     logger.info("OpenWhisk deployment completed successfully")
 
 
-def deploy_to_gcp(workflow_data):
-    """Deploys functions to Google Cloud Functions"""
+def deploy_to_gcp(workflow_data, gcp_actions):
+    """Deploys the given actions (name -> action data) to Google Cloud Functions"""
     logger.info("Deploying to Google Cloud Functions...")
 
     gcp_secret_key = os.getenv("GCP_SecretKey")
@@ -654,21 +778,12 @@ def deploy_to_gcp(workflow_data):
         )
         sys.exit(1)
 
-    # Filter actions to be deployed to GCP
-    gcp_actions = {}
-    for action_name, action_data in workflow_data["ActionList"].items():
-        server_name = action_data["FaaSServer"]
-        server_config = workflow_data["ComputeServers"][server_name]
-        faas_type = server_config["FaaSType"].lower()
-        if faas_type == "googlecloud":
-            gcp_actions[action_name] = action_data
-
     if not gcp_actions:
         logger.info("No actions found for Google Cloud deployment")
         return
 
     # Get GCP configuration
-    first_action = list(gcp_actions.values())[0]
+    first_action = next(iter(gcp_actions.values()))
     server_name = first_action["FaaSServer"]
     server_config = workflow_data["ComputeServers"][server_name]
 
@@ -689,29 +804,24 @@ def deploy_to_gcp(workflow_data):
     for action_name, action_data in gcp_actions.items():
         logger.info(f"Deploying GCP Cloud Function: {action_name}")
 
-        # Get container image
-        container_image = workflow_data.get("ActionContainers", {}).get(action_name)
-
-        if not container_image:
-            logger.error(f"No container specified for action: {action_name}")
-            sys.exit(1)
+        container_image = workflow_data["ActionContainers"][action_name]
 
         function_name = f"{workflow_data.get('WorkflowName', 'faasr')}-{action_name}"
 
         # Deploy using gcloud CLI
-        deploy_cmd = f"""
-        gcloud functions deploy {function_name} \
-            --gen2 \
-            --runtime=python311 \
-            --region={region} \
-            --source=. \
-            --entry-point=main \
-            --trigger-http \
-            --allow-unauthenticated \
-            --docker-repository={container_image}
-        """
-
-        result = subprocess.run(deploy_cmd, shell=True, capture_output=True, text=True)
+        deploy_cmd = [
+            "gcloud", "functions", "deploy", function_name,
+            "--gen2",
+            "--runtime=python311",
+            f"--region={region}",
+            "--source=.",
+            "--entry-point=main",
+            "--trigger-http",
+            "--allow-unauthenticated",
+            f"--docker-repository={container_image}",
+        ]
+
+        result = subprocess.run(deploy_cmd, capture_output=True, text=True)
 
         if result.returncode != 0:
             logger.error(
@@ -724,10 +834,14 @@ def deploy_to_gcp(workflow_data):
     logger.info("Google Cloud deployment completed successfully")
 
 
-def deploy_to_slurm(workflow_data):
+def deploy_to_slurm(workflow_data, slurm_bucket):
     """
     Validates SLURM configuration for workflow actions.
     Does not create persistent resources - jobs are submitted at invocation time.
+
+    Args:
+        workflow_data: Workflow JSON data
+        slurm_bucket: Actions to validate for SLURM (name -> action data)
     """
     logger.info("Validating SLURM configuration...")
 
@@ -735,31 +849,34 @@ def deploy_to_slurm(workflow_data):
     slurm_actions = {}
     slurm_servers = {}
 
-    for action_name, action_data in workflow_data["ActionList"].items():
+    for action_name, action_data in slurm_bucket.items():
         server_name = action_data["FaaSServer"]
-        server_config = workflow_data["ComputeServers"][server_name]
-        faas_type = server_config["FaaSType"].lower()
-
-        if faas_type == "slurm":
-            if server_name not in slurm_actions:
-                slurm_actions[server_name] = []
-                slurm_servers[server_name] = server_config.copy()
-            slurm_actions[server_name].append(action_name)
+        if server_name not in slurm_actions:
+            slurm_actions[server_name] = []
+            slurm_servers[server_name] = workflow_data["ComputeServers"][server_name]
+        slurm_actions[server_name].append(action_name)
 
     if not slurm_actions:
         logger.info("No actions found for SLURM deployment")
         return
 
+    # Validate server configurations before contacting any server
+    for server_name, server_config in slurm_servers.items():
+        validate_slurm_server_config(server_name, server_config)
+
+    # Test connectivity to all servers concurrently
+    with _platform_executor(min(8, len(slurm_servers))) as executor:
+        reachable = dict(zip(
+            slurm_servers,
+            executor.map(test_slurm_connectivity, slurm_servers, slurm_servers.values()),
+        ))
+
     # Process each SLURM server
     for server_name, actions in slurm_actions.items():
         logger.info(f"Registering workflow for SLURM: {server_name}")
         server_config = slurm_servers[server_name]
 
-        # Validate server configuration
-        validate_slurm_server_config(server_name, server_config)
-
-        # Test connectivity
-        if not test_slurm_connectivity(server_name, server_config):
+        if not reachable[server_name]:
             logger.error(f"Failed to connect to SLURM server: {server_name}")
             sys.exit(1)
 
@@ -801,6 +918,16 @@ def validate_slurm_server_config(server_name, server_config):
     )
 
 
+# Headers for SLURM REST API requests; treated as read-only
+_SLURM_HEADERS = {"Accept": "application/json"}
+
+
+@functools.lru_cache(maxsize=None)
+def _slurm_auth_headers(token, username):
+    """SLURM request headers carrying a JWT token and user name (read-only)"""
+    return {**_SLURM_HEADERS, "X-SLURM-USER-TOKEN": token, "X-SLURM-USER-NAME": username}
+
+
 def test_slurm_connectivity(server_name, server_config):
     """
     Test connectivity to SLURM REST API endpoint (mirrors R implementation).
@@ -822,24 +949,21 @@ def test_slurm_connectivity(server_name, server_config):
     # Test ping endpoint
     ping_url = f"{endpoint}/slurm/{api_version}/ping"
 
-    # Prepare headers
-    headers = {"Accept": "application/json"}
-
     # Add JWT token and username if available (for auth testing)
     slurm_token = os.getenv("SLURM_Token")
     if slurm_token:
-        headers["X-SLURM-USER-TOKEN"] = slurm_token
-        username = server_config.get("UserName", "ubuntu")
-        headers["X-SLURM-USER-NAME"] = username
+        headers = _slurm_auth_headers(slurm_token, server_config.get("UserName", "ubuntu"))
 
         # Validate token format
         if not slurm_token.startswith("eyJ"):
             logger.warning(
                 f"SLURM_Token for '{server_name}' doesn't appear to be a valid JWT token"
             )
+    else:
+        headers = _SLURM_HEADERS
 
     try:
-        response = requests.get(ping_url, headers=headers, timeout=10)
+        response = _HTTP.get(ping_url, headers=headers, timeout=10)
 
         if response.status_code == 200:
             logger.info(f"✓ SLURM connectivity test passed for: {server_name}")
@@ -871,11 +995,7 @@ def validate_slurm_action(action_name, workflow_data, server_config):
     """
     action_config = workflow_data["ActionList"][action_name]
 
-    # Validate container image
-    container_image = workflow_data.get("ActionContainers", {}).get(action_name)
-    if not container_image:
-        logger.error(f"No container specified for SLURM action: {action_name}")
-        sys.exit(1)
+    container_image = workflow_data["ActionContainers"][action_name]
 
     # Get resource requirements using fallback hierarchy
     resources = get_slurm_resource_requirements(
@@ -891,11 +1011,27 @@ def validate_slurm_action(action_name, workflow_data, server_config):
     )
 
 
+# SLURM resource settings: (config key, workflow key, default). Each is taken
+# from the action's Resources, then the server config, then the default
+_SLURM_FIELDS = (
+    ("partition", "Partition", "faasr"),
+    ("nodes", "Nodes", 1),
+    ("tasks", "Tasks", 1),
+    ("cpus_per_task", "CPUsPerTask", 1),
+    ("memory_mb", "Memory", 1024),
+    ("time_limit", "TimeLimit", 60),
+    ("working_dir", "WorkingDirectory", "/tmp"),
+)
+
+
 def get_slurm_resource_requirements(action_name, action_config, server_config):
     """
     Extract SLURM resource requirements with fallback hierarchy.
     Function-level → Server-level → Default values
 
+    Only missing or null values fall through, so explicit values such as
+    Nodes: 0 are kept as given.
+
     Args:
         action_name: Name of the action
         action_config: Action configuration dict
@@ -905,38 +1041,28 @@ def get_slurm_resource_requirements(action_name, action_config, server_config):
         dict: Resource configuration
     """
     # Function-level resources (highest priority)
-    function_resources = action_config.get("Resources", {})
-
-    # Extract with fallback hierarchy
-    config = {
-        "partition": (
-            function_resources.get("Partition")
-            or server_config.get("Partition")
-            or "faasr"
-        ),
-        "nodes": (function_resources.get("Nodes") or server_config.get("Nodes") or 1),
-        "tasks": (function_resources.get("Tasks") or server_config.get("Tasks") or 1),
-        "cpus_per_task": (
-            function_resources.get("CPUsPerTask")
-            or server_config.get("CPUsPerTask")
-            or 1
-        ),
-        "memory_mb": (
-            function_resources.get("Memory") or server_config.get("Memory") or 1024
-        ),
-        "time_limit": (
-            function_resources.get("TimeLimit") or server_config.get("TimeLimit") or 60
-        ),
-        "working_dir": (
-            function_resources.get("WorkingDirectory")
-            or server_config.get("WorkingDirectory")
-            or "/tmp"
-        ),
-    }
+    function_resources = action_config.get("Resources") or {}
+
+    config = {}
+    for field, key, default in _SLURM_FIELDS:
+        value = function_resources.get(key)
+        if value is None:
+            value = server_config.get(key)
+        config[field] = default if value is None else value
 
     return config
 
 
+# Deployer for each lowercased FaaSType; each takes (workflow_data, actions)
+_DEPLOYERS = {
+    "lambda": deploy_to_aws,
+    "githubactions": deploy_to_github,
+    "openwhisk": deploy_to_ow,
+    "googlecloud": deploy_to_gcp,
+    "slurm": deploy_to_slurm,
+}
+
+
 def main():
     args = parse_arguments()
     
@@ -947,7 +1073,6 @@ def main():
             sys.exit(1)
     
     workflow_data = read_workflow_file(args.workflow_file)
-
     # Store the workflow file path in the workflow data
     workflow_data["_workflow_file"] = args.workflow_file
 
@@ -959,7 +1084,8 @@ def main():
     except SystemExit:
         logger.info("Workflow validation failed - check logs for details")
 
-    # Verify if custom containers are specified correctly
+    # Verify every action has a container and custom containers are allowed
+    check_action_containers(workflow_data)
     verify_containers(workflow_data)
 
     # Get workflow name and entry action
@@ -987,7 +1113,7 @@ def main():
         else:
             branch = "main"
         
-        clean_path = args.workflow_file.lstrip('./')
+        clean_path = args.workflow_file.removeprefix('./').lstrip('/')
         payload_url = f"https://raw.githubusercontent.com/{github_repo}/{branch}/{clean_path}"
         logger.info(f"Default payload URL: {payload_url}")
         
@@ -996,10 +1122,11 @@ def main():
         logger.info("Regular registration mode: Will register workflows without schedule")
 
     # Get all unique FaaSTypes from workflow data
-    faas_types = set()
-    for server in workflow_data.get("ComputeServers", {}).values():
-        if "FaaSType" in server:
-            faas_types.add(server["FaaSType"].lower())
+    faas_types = {
+        server["FaaSType"].lower()
+        for server in workflow_data.get("ComputeServers", {}).values()
+        if "FaaSType" in server
+    }
 
     if not faas_types:
         logger.error("Error: No FaaSType found in workflow file")
@@ -1007,23 +1134,36 @@ def main():
 
     logger.info(f"Found FaaS platforms: {', '.join(faas_types)}")
 
-    # Deploy to each platform found
-    for faas_type in faas_types:
-        logger.info(f"\nDeploying to {faas_type}...")
-        if faas_type == "lambda":
-            deploy_to_aws(workflow_data)
-        elif faas_type == "githubactions":
-            # Pass timer parameters to GitHub Actions deployment
-            deploy_to_github(workflow_data, cron_schedule=cron_to_use, payload_url=payload_url, entry_action=entry_action)
-        elif faas_type == "openwhisk":
-            deploy_to_ow(workflow_data)
-        elif faas_type == "googlecloud":
-            deploy_to_gcp(workflow_data)
-        elif faas_type == "slurm":
-            deploy_to_slurm(workflow_data)
-        else:
-            logger.error(f"Unsupported FaaSType: {faas_type}")
-            sys.exit(1)
+    # Classify actions by platform once; each deployer gets its own bucket
+    action_buckets = _bucket_actions_by_faastype(workflow_data)
+
+    # Pass timer parameters to GitHub Actions deployment
+    deployers = dict(_DEPLOYERS, githubactions=functools.partial(
+        deploy_to_github, cron_schedule=cron_to_use, payload_url=payload_url, entry_action=entry_action
+    ))
+    unsupported = faas_types - deployers.keys()
+    if unsupported:
+        logger.error(f"Unsupported FaaSType: {', '.join(sorted(unsupported))}")
+        sys.exit(1)
+
+    # Deploy to each platform found. Platforms are independent and the
+    # deployers only read workflow_data, so they share it across threads
+    # without locking; log lines are prefixed with the platform name.
+    # Every platform starts at once, so a failing platform does not stop
+    # the others: its failure is reported as soon as it happens, the rest
+    # run to completion, and then its exit is re-raised
+    with ThreadPoolExecutor(max_workers=len(faas_types)) as executor:
+        futures = {}
+        for faas_type in faas_types:
+            logger.info(f"\nDeploying to {faas_type}...")
+            futures[executor.submit(
+                _deploy_platform, faas_type, deployers[faas_type],
+                workflow_data, action_buckets.get(faas_type, {}),
+            )] = faas_type
+        for future in as_completed(futures):
+            if future.exception() is not None:
+                logger.error(f"Deployment to {futures[future]} failed")
+            future.result()
     
     # Final message
     logger.info("")
@@ -4,14 +4,27 @@ Script to set cron timers for FaaSr workflows on GitHub Actions
 Modifies the registered action workflow to add schedule trigger
 """
 import argparse
+import bisect
+import functools
 import os
+import re
 import sys
 import logging
-import json
-import yaml
 from pathlib import Path
-from croniter import croniter
-from datetime import datetime
+from _timer_common import (
+    ENV_LINE_RE,
+    SCHEDULE_BLOCK_RE,
+    commit_and_push,
+    find_input_block,
+    get_entry_action,
+    get_workflow_yaml_path,
+    load_workflow_json,
+    preflight,
+    read_workflow_yaml,
+    split_on_block,
+    write_text_atomic,
+    write_workflow_yaml,
+)
 
 logging.basicConfig(
     level=logging.INFO,
@@ -40,11 +53,111 @@ def parse_arguments():
     return parser.parse_args()
 
 
+# Five whitespace-separated fields; anything else is rejected without croniter
+_CRON_RE = re.compile(r'^\s*\S+\s+\S+\s+\S+\s+\S+\s+\S+\s*$')
+
+
+# Numeric cron fields handled without croniter: *, N, N-M, with optional /step
+_CRON_ITEM_RE = re.compile(r'^(?:\*|(\d+)(?:-(\d+))?)(?:/(\d+))?$')
+_CRON_FIELD_RANGES = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+
+
+def _parse_cron_field(field, low, high):
+    """Set of values matched by a numeric cron field, or None if not handled here"""
+    values = set()
+    for item in field.split(','):
+        match = _CRON_ITEM_RE.match(item)
+        if not match:
+            return None
+        start, end, step = match.groups()
+        if start is None:
+            start, end = low, high
+        elif end is None and not step:
+            start = end = int(start)
+        else:
+            start = int(start)
+            end = int(end) if end is not None else high
+            # croniter reads a one-value range (5-5, 59/10) as the whole cycle
+            if start == end:
+                return None
+        step = int(step) if step else 1
+        if not low <= start <= end <= high or step == 0:
+            return None
+        values.update(range(start, end + 1, step))
+    return values
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_cron_fields(cron_expr):
+    """
+    Parse a plain numeric 5-field cron expression
+
+    Returns None for anything croniter has to decide on (names, macros,
+    wrapped ranges, stepped weekdays, or both day fields restricted, which
+    cron ORs together)
+    """
+    fields = cron_expr.split()
+    if len(fields) != 5 or (fields[2] != '*' and fields[4] != '*') or '/' in fields[4]:
+        return None
+    parsed = []
+    for field, (low, high) in zip(fields, _CRON_FIELD_RANGES):
+        values = _parse_cron_field(field, low, high)
+        if values is None:
+            return None
+        parsed.append(values)
+    minutes, hours, days, months, weekdays = parsed
+    if 7 in weekdays:
+        weekdays.add(0)
+    slots = sorted(hour * 60 + minute for hour in hours for minute in minutes)
+    return slots, frozenset(days), frozenset(months), frozenset(weekdays)
+
+
+def _cron_fast_next(fields, start):
+    """Next minute after start matching parsed cron fields, or None if not found"""
+    from datetime import timedelta
+    slots, days, months, weekdays = fields
+    first = start.hour * 60 + start.minute + 1
+    day = start.replace(hour=0, minute=0, second=0, microsecond=0)
+    # Four years covers every reachable date, including Feb 29
+    for _ in range(4 * 366 + 1):
+        if day.month in months and day.day in days and day.isoweekday() % 7 in weekdays:
+            index = bisect.bisect_left(slots, first)
+            if index < len(slots):
+                return day + timedelta(minutes=slots[index])
+        day += timedelta(days=1)
+        first = 0
+    return None
+
+
+@functools.lru_cache(maxsize=128)
+def _next_cron_run(cron_expr, start):
+    """Next run of a cron expression after start (cached per expression and minute)"""
+    fields = _parse_cron_fields(cron_expr)
+    if fields is not None:
+        next_run = _cron_fast_next(fields, start)
+        if next_run is not None:
+            return next_run
+    from datetime import datetime
+    from croniter import croniter
+    return croniter(cron_expr, start).get_next(datetime)
+
+
 def validate_cron_expression(cron_expr):
     """Validate cron expression syntax"""
+    from datetime import datetime
     try:
-        iter = croniter(cron_expr, datetime.now())
-        next_run = iter.get_next(datetime)
+        if not _CRON_RE.match(cron_expr):
+            raise ValueError("expected 5 fields: minute hour day month weekday")
+        
+        if not logger.isEnabledFor(logging.INFO):
+            if _parse_cron_fields(cron_expr) is not None:
+                return True
+            from croniter import croniter
+            croniter(cron_expr)  # Parse only; the next run is just for the log
+            return True
+        
+        # Cron has minute resolution, so truncating keeps the result the same
+        next_run = _next_cron_run(cron_expr, datetime.now().replace(second=0, microsecond=0))
         
         logger.info(f"Cron expression validated: {cron_expr}")
         logger.info(f"Next scheduled run: {next_run.strftime('%Y-%m-%d %H:%M:%S')}")
@@ -52,49 +165,23 @@ def validate_cron_expression(cron_expr):
         return True
         
     except (ValueError, KeyError) as e:
-        logger.error(f"Invalid cron expression: {cron_expr}")
-        logger.error(f"Error: {e}")
-        logger.error("")
-        logger.error("Cron format: minute hour day month weekday")
-        logger.error("Examples:")
-        logger.error("  */5 * * * *     - Every 5 minutes")
-        logger.error("  0 * * * *       - Every hour")
-        logger.error("  0 0 * * *       - Every day at midnight")
-        logger.error("  0 0 * * 0       - Every Sunday at midnight")
-        logger.error("  30 2 * * 1-5    - Weekdays at 2:30 AM")
+        # One record, formatted only if the handler emits it
+        logger.error(
+            "Invalid cron expression: %s\n"
+            "Error: %s\n"
+            "\n"
+            "Cron format: minute hour day month weekday\n"
+            "Examples:\n"
+            "  */5 * * * *     - Every 5 minutes\n"
+            "  0 * * * *       - Every hour\n"
+            "  0 0 * * *       - Every day at midnight\n"
+            "  0 0 * * 0       - Every Sunday at midnight\n"
+            "  30 2 * * 1-5    - Weekdays at 2:30 AM",
+            cron_expr, e
+        )
         return False
 
 
-def load_workflow_json(workflow_path):
-    """Load and parse the workflow JSON file"""
-    if not Path(workflow_path).is_file():
-        logger.error(f"Workflow file not found: {workflow_path}")
-        sys.exit(1)
-    
-    try:
-        with open(workflow_path, 'r') as f:
-            workflow_data = json.load(f)
-        return workflow_data
-    except json.JSONDecodeError as e:
-        logger.error(f"Failed to parse workflow JSON: {e}")
-        sys.exit(1)
-
-
-def get_entry_action(workflow_data):
-    """Get the entry action (FunctionInvoke) from workflow"""
-    entry_action = workflow_data.get("FunctionInvoke")
-    if not entry_action:
-        logger.error("FunctionInvoke not found in workflow JSON")
-        sys.exit(1)
-    
-    if entry_action not in workflow_data.get("ActionList", {}):
-        logger.error(f"Entry action '{entry_action}' not found in ActionList")
-        sys.exit(1)
-    
-    logger.info(f"Entry action: {entry_action}")
-    return entry_action
-
-
 def get_github_actions_config(workflow_data, entry_action):
     """Extract and validate GitHub Actions configuration"""
     try:
@@ -128,17 +215,9 @@ def get_github_actions_config(workflow_data, entry_action):
         sys.exit(1)
 
 
-def get_workflow_yaml_path(workflow_name, entry_action):
-    """Get the path to the workflow YAML file"""
-    workflow_file = f"{workflow_name}-{entry_action}.yml"
-    yaml_path = f".github/workflows/{workflow_file}"
-    
-    return yaml_path, workflow_file
-
-
 def check_workflow_registered(yaml_path):
     """Check if workflow YAML file exists"""
-    if not Path(yaml_path).is_file():
+    if not os.path.isfile(yaml_path):
         logger.error(f"Workflow YAML file not found: {yaml_path}")
         logger.error("")
         logger.error("This workflow has not been registered yet.")
@@ -148,20 +227,6 @@ def check_workflow_registered(yaml_path):
     return True
 
 
-def read_workflow_yaml(yaml_path):
-    """Read existing workflow YAML file"""
-    try:
-        with open(yaml_path, 'r') as f:
-            workflow_yaml = yaml.safe_load(f)
-        return workflow_yaml
-    except yaml.YAMLError as e:
-        logger.error(f"Failed to parse workflow YAML: {e}")
-        sys.exit(1)
-    except Exception as e:
-        logger.error(f"Failed to read workflow YAML: {e}")
-        sys.exit(1)
-
-
 def get_payload_url(workflow_file_path, github_repo, branch):
     """
     Construct the payload URL in the format that works with FaaSrPayload
@@ -169,7 +234,7 @@ def get_payload_url(workflow_file_path, github_repo, branch):
     The container's FaaSrPayload class adds the prefix internally
     """
     # Remove any leading './' or '/' from workflow file path
-    clean_path = workflow_file_path.lstrip('./')
+    clean_path = workflow_file_path.removeprefix('./').lstrip('/')
     
     # Construct the SHORT format that FaaSrPayload expects
     # Format: owner/repo/branch/file.json
@@ -179,53 +244,158 @@ def get_payload_url(workflow_file_path, github_repo, branch):
     return payload_url
 
 
+# Slash-separated paths that can be written as plain YAML scalars
+_PLAIN_PATH_RE = re.compile(r'[\w.-]+(?:/[\w.-]+)+')
+
+
+def _yaml_text_scalar(value):
+    """YAML text for a string: plain for slash-separated paths, else single-quoted"""
+    if _PLAIN_PATH_RE.fullmatch(value):
+        return value
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _yaml_text_value(text):
+    """String value of a one-line plain or quoted scalar as written"""
+    text = text.strip()
+    if len(text) >= 2 and text[0] == text[-1] == "'":
+        return text[1:-1].replace("''", "'")
+    if len(text) >= 2 and text[0] == text[-1] == '"':
+        return text[1:-1]
+    return text
+
+
+def _patch_input_text(body, default):
+    """Make a workflow_dispatch input block optional with a default, or None"""
+    required = re.search(r'^([ \t]+)required:[ \t]*(true|false)[ \t]*\n', body, re.M)
+    if not required:
+        return None
+    indent = required.group(1)
+    
+    defaults = re.findall(r'^([ \t]+)default:[ \t]*(.*)\n', body, re.M)
+    if len(defaults) > 1 or any(i != indent or v[:1] in ('|', '>') for i, v in defaults):
+        return None
+    if required.group(2) == 'false' and defaults and _yaml_text_value(defaults[0][1]) == default:
+        return body
+    
+    body = re.sub(r'^[ \t]+default:.*\n', '', body, flags=re.M)
+    return re.sub(
+        r'^[ \t]+required:.*\n',
+        lambda m: f"{indent}required: false\n{indent}default: {_yaml_text_scalar(default)}\n",
+        body, count=1, flags=re.M
+    )
+
+
+def _env_fallbacks(payload_url):
+    """OVERWRITTEN/PAYLOAD_URL env values with defaults for scheduled runs"""
+    return {
+        'OVERWRITTEN': "${{ github.event.inputs.OVERWRITTEN || '{}' }}",
+        'PAYLOAD_URL': f"${{{{ github.event.inputs.PAYLOAD_URL || '{payload_url}' }}}}",
+    }
+
+
+def _patch_env_text(text, payload_url):
+    """Add the scheduled-run fallbacks to OVERWRITTEN/PAYLOAD_URL env lines, or None"""
+    fallbacks = _env_fallbacks(payload_url)
+    parts = []
+    pos = 0
+    for m in ENV_LINE_RE.finditer(text):
+        key, value = m.groups()
+        if '||' in value:
+            continue
+        if value != f"${{{{ github.event.inputs.{key} }}}}":
+            return None
+        parts += [text[pos:m.start(2)], fallbacks[key]]
+        pos = m.end(2)
+    parts.append(text[pos:])
+    return ''.join(parts)
+
+
+def patch_timer_in_text(text, cron_schedule, payload_url):
+    """
+    Apply the set_timer_in_yaml edits directly to workflow YAML text
+    Returns the patched text, or None when the layout is not recognised
+    """
+    parts = split_on_block(text)
+    if parts is None or not _PLAIN_PATH_RE.fullmatch(payload_url):
+        return None
+    head, on_body, rest, indent = parts
+    
+    # CHANGES 1-2: Make OVERWRITTEN and PAYLOAD_URL inputs optional with defaults
+    for key, default in (('OVERWRITTEN', '{}'), ('PAYLOAD_URL', payload_url)):
+        block = find_input_block(on_body, key)
+        if block is False:
+            return None
+        if block:
+            patched = _patch_input_text(block.group(2), default)
+            if patched is None:
+                return None
+            on_body = on_body[:block.start(2)] + patched + on_body[block.end(2):]
+    
+    # CHANGE 3: Add or replace the schedule
+    schedule = f"{indent}schedule:\n{indent}  - cron: {_yaml_text_scalar(cron_schedule)}\n"
+    block = SCHEDULE_BLOCK_RE.search(on_body)
+    if block:
+        if block.group(1) != indent:
+            return None
+        current = re.fullmatch(rf'{indent}schedule:[ \t]*\n{indent}(?:[ \t]+)?- cron:[ \t]*(.*?)[ \t]*\n', block.group(0))
+        if not (current and _yaml_text_value(current.group(1)) == cron_schedule):
+            on_body = on_body[:block.start()] + schedule + on_body[block.end():]
+    elif re.search(r'^[ \t]+schedule:', on_body, re.M):
+        return None
+    else:
+        on_body = schedule + on_body
+    
+    # CHANGE 4: Env vars use || fallbacks
+    head = _patch_env_text(head, payload_url)
+    rest = _patch_env_text(rest, payload_url)
+    if head is None or rest is None:
+        return None
+    return head + on_body + rest
+
+
 def set_timer_in_yaml(workflow_yaml, cron_schedule, payload_url):
     """
     Add or update cron schedule in workflow YAML
     Match the exact structure of the working YAML
+    Returns the workflow and whether anything had to change
     """
     
-    # Handle 'on' key (PyYAML sometimes parses it as True or 'true')
-    on_section = None
-    on_key = None
-    
-    for key in ['on', True, 'true']:
-        if key in workflow_yaml:
-            on_section = workflow_yaml[key]
-            on_key = key
+    # Handle 'on' key (PyYAML parses an unquoted 'on' as True); it is
+    # popped and put back as 'on' below
+    for key in (True, 'on', 'true'):
+        on_section = workflow_yaml.pop(key, None)
+        if on_section is not None:
             break
-    
-    if on_section is None:
+    else:
         logger.error("Could not find 'on' section in workflow YAML")
         sys.exit(1)
     
-    # Remove old key if it's not 'on'
-    if on_key != 'on':
-        del workflow_yaml[on_key]
-    
     # Ensure on_section is a dict
-    if not isinstance(on_section, dict):
+    changed = not isinstance(on_section, dict)
+    if changed:
         on_section = {}
     
     # Update workflow_dispatch inputs to support scheduled runs
-    if 'workflow_dispatch' in on_section:
-        if 'inputs' in on_section['workflow_dispatch']:
-            inputs = on_section['workflow_dispatch']['inputs']
-            
-            # CHANGE 1: Update OVERWRITTEN input
-            if 'OVERWRITTEN' in inputs:
-                inputs['OVERWRITTEN']['required'] = False  # ← Changed from true to false
-                inputs['OVERWRITTEN']['default'] = '{}'    # ← Added default
-                logger.info("✓ Updated OVERWRITTEN: required=false, default='{}'")
-            
-            # CHANGE 2: Update PAYLOAD_URL input  
-            if 'PAYLOAD_URL' in inputs:
-                inputs['PAYLOAD_URL']['required'] = False   # ← Changed from true to false
-                inputs['PAYLOAD_URL']['default'] = payload_url  # ← Added default
-                logger.info(f"✓ Updated PAYLOAD_URL: required=false, default='{payload_url}'")
+    inputs = (on_section.get('workflow_dispatch') or {}).get('inputs') or {}
+    
+    # CHANGE 1: Update OVERWRITTEN input
+    if 'OVERWRITTEN' in inputs:
+        changed |= inputs['OVERWRITTEN'].get('required') is not False or inputs['OVERWRITTEN'].get('default') != '{}'
+        inputs['OVERWRITTEN']['required'] = False  # ← Changed from true to false
+        inputs['OVERWRITTEN']['default'] = '{}'    # ← Added default
+        logger.info("✓ Updated OVERWRITTEN: required=false, default='{}'")
+    
+    # CHANGE 2: Update PAYLOAD_URL input
+    if 'PAYLOAD_URL' in inputs:
+        changed |= inputs['PAYLOAD_URL'].get('required') is not False or inputs['PAYLOAD_URL'].get('default') != payload_url
+        inputs['PAYLOAD_URL']['required'] = False   # ← Changed from true to false
+        inputs['PAYLOAD_URL']['default'] = payload_url  # ← Added default
+        logger.info(f"✓ Updated PAYLOAD_URL: required=false, default='{payload_url}'")
     
     # CHANGE 3: Add schedule section
     had_schedule = 'schedule' in on_section
+    changed |= on_section.get('schedule') != [{'cron': cron_schedule}]
     on_section['schedule'] = [{'cron': cron_schedule}]
     
     if had_schedule:
@@ -238,6 +408,7 @@ def set_timer_in_yaml(workflow_yaml, cron_schedule, payload_url):
     
     # CHANGE 4: Update env vars to use || operator for defaults
     if 'jobs' in workflow_yaml:
+        fallbacks = _env_fallbacks(payload_url)
         for job_name, job_config in workflow_yaml['jobs'].items():
             if 'env' in job_config:
                 env_vars = job_config['env']
@@ -246,123 +417,33 @@ def set_timer_in_yaml(workflow_yaml, cron_schedule, payload_url):
                 if 'OVERWRITTEN' in env_vars:
                     current = str(env_vars['OVERWRITTEN'])
                     if '||' not in current:
-                        env_vars['OVERWRITTEN'] = "${{ github.event.inputs.OVERWRITTEN || '{}' }}"
+                        changed = True
+                        env_vars['OVERWRITTEN'] = fallbacks['OVERWRITTEN']
                         logger.info("✓ Updated OVERWRITTEN env to use default fallback")
                 
                 # Update PAYLOAD_URL env var
                 if 'PAYLOAD_URL' in env_vars:
                     current = str(env_vars['PAYLOAD_URL'])
                     if '||' not in current:
-                        env_vars['PAYLOAD_URL'] = f"${{{{ github.event.inputs.PAYLOAD_URL || '{payload_url}' }}}}"
+                        changed = True
+                        env_vars['PAYLOAD_URL'] = fallbacks['PAYLOAD_URL']
                         logger.info("✓ Updated PAYLOAD_URL env to use default fallback")
     
-    return workflow_yaml
-
-
-def write_workflow_yaml(yaml_path, workflow_yaml):
-    """Write updated workflow YAML back to file with proper key ordering"""
-    try:
-        # Custom representer to handle GitHub Actions expressions
-        def str_representer(dumper, data):
-            if '${{' in data and '}}' in data:
-                # Don't quote strings with GitHub Actions expressions
-                return dumper.represent_scalar('tag:yaml.org,2002:str', data, style='')
-            return dumper.represent_scalar('tag:yaml.org,2002:str', data)
-        
-        yaml.add_representer(str, str_representer)
-        
-        # CRITICAL FIX: Rebuild workflow_yaml in the correct order
-        ordered_workflow = {}
-        
-        # Order 1: name (if exists)
-        if 'name' in workflow_yaml:
-            ordered_workflow['name'] = workflow_yaml['name']
-        
-        # Order 2: on
-        if 'on' in workflow_yaml:
-            ordered_workflow['on'] = workflow_yaml['on']
-        
-        # Order 3: jobs
-        if 'jobs' in workflow_yaml:
-            ordered_workflow['jobs'] = workflow_yaml['jobs']
-        
-        # Order 4: any other keys
-        for key in workflow_yaml:
-            if key not in ['name', 'on', 'jobs']:
-                ordered_workflow[key] = workflow_yaml[key]
-        
-        # Dump YAML with ordered structure
-        yaml_content = yaml.dump(
-            ordered_workflow,
-            default_flow_style=False,
-            sort_keys=False,
-            width=1000,
-            allow_unicode=True
-        )
-        
-        # Fix 'on:' being converted to something else
-        yaml_content = yaml_content.replace('true:', 'on:', 1)
-        yaml_content = yaml_content.replace('"on":', 'on:', 1)
-        yaml_content = yaml_content.replace("'on':", 'on:', 1)
-        
-        with open(yaml_path, 'w') as f:
-            f.write(yaml_content)
-        
-        logger.info(f"✓ Wrote updated YAML to: {yaml_path}")
-        
-    except Exception as e:
-        logger.error(f"Failed to write workflow YAML: {e}")
-        sys.exit(1)
+    return workflow_yaml, changed
 
 
 def commit_and_push_changes(yaml_path, workflow_file, cron_schedule, branch):
     """Commit and push changes to GitHub"""
-    import subprocess
-    
-    try:
-        result = subprocess.run(
-            ['git', 'diff', '--quiet', yaml_path],
-            capture_output=True
-        )
-        
-        if result.returncode == 0:
-            logger.info("No changes detected - timer already set")
-            return
-        
-        subprocess.run(['git', 'add', yaml_path], check=True, capture_output=True)
-        
-        commit_msg = f"FaaSr: Set timer '{cron_schedule}' for {workflow_file}"
-        subprocess.run(
-            ['git', 'commit', '-m', commit_msg],
-            check=True,
-            capture_output=True
-        )
-        
-        subprocess.run(
-            ['git', 'push', 'origin', branch],
-            check=True,
-            capture_output=True
-        )
-        
-        logger.info(f"✓ Committed and pushed to branch: {branch}")
-        
-    except subprocess.CalledProcessError as e:
-        logger.error("Git operation failed")
-        if e.stdout:
-            logger.error(f"Output: {e.stdout.decode()}")
-        if e.stderr:
-            logger.error(f"Error: {e.stderr.decode()}")
-        sys.exit(1)
+    commit_msg = f"FaaSr: Set timer '{cron_schedule}' for {workflow_file}"
+    commit_and_push(yaml_path, commit_msg, branch, "No changes detected - timer already set")
 
 
 def main():
     """Main execution function"""
     args = parse_arguments()
     
-    gh_token = os.getenv("GH_PAT")
-    if not gh_token:
-        logger.error("GH_PAT environment variable not set")
-        sys.exit(1)
+    # Fail fast on missing configuration before any parsing
+    _, github_repo = preflight(args.workflow_file, "GH_PAT", "GITHUB_REPOSITORY")
     
     if not validate_cron_expression(args.cron):
         sys.exit(1)
@@ -379,22 +460,30 @@ def main():
     yaml_path, workflow_file = get_workflow_yaml_path(workflow_name, entry_action)
     check_workflow_registered(yaml_path)
     
-    # Get GitHub repo from environment
-    github_repo = os.getenv("GITHUB_REPOSITORY")
-    if not github_repo:
-        logger.error("GITHUB_REPOSITORY environment variable not set")
-        sys.exit(1)
-    
     # Construct payload URL (SHORT format without https:// prefix)
     payload_url = get_payload_url(args.workflow_file, github_repo, gh_config['branch'])
     
-    # Read, update, and write YAML
-    workflow_yaml = read_workflow_yaml(yaml_path)
-    workflow_yaml = set_timer_in_yaml(workflow_yaml, args.cron, payload_url)
-    write_workflow_yaml(yaml_path, workflow_yaml)
+    # Patch the YAML text in place when its layout is recognised; otherwise
+    # read, update, and write the parsed YAML
+    yaml_file = Path(yaml_path)
+    text = yaml_file.read_text()
+    patched = patch_timer_in_text(text, args.cron, payload_url)
+    if patched is not None:
+        changed = patched != text
+        if changed:
+            write_text_atomic(yaml_file, patched)
+            logger.info(f"✓ Set schedule {args.cron} and run defaults in: {yaml_path}")
+    else:
+        workflow_yaml = read_workflow_yaml(yaml_path)
+        workflow_yaml, changed = set_timer_in_yaml(workflow_yaml, args.cron, payload_url)
+        if changed:
+            write_workflow_yaml(yaml_path, workflow_yaml)
     
-    # Commit and push
-    commit_and_push_changes(yaml_path, workflow_file, args.cron, gh_config['branch'])
+    if changed:
+        # Commit and push
+        commit_and_push_changes(yaml_path, workflow_file, args.cron, gh_config['branch'])
+    else:
+        logger.info("No changes detected - timer already set")
     
     logger.info("")
     logger.info("=" * 60)
@@ -5,11 +5,24 @@ Removes schedule section and restores inputs to required=true
 """
 import argparse
 import os
+import re
 import sys
 import logging
-import json
-import yaml
 from pathlib import Path
+from _timer_common import (
+    ENV_LINE_RE,
+    SCHEDULE_BLOCK_RE,
+    commit_and_push,
+    find_input_block,
+    get_entry_action,
+    get_workflow_yaml_path,
+    load_workflow_json,
+    preflight,
+    read_workflow_yaml,
+    split_on_block,
+    write_text_atomic,
+    write_workflow_yaml,
+)
 
 logging.basicConfig(
     level=logging.INFO,
@@ -33,36 +46,6 @@ def parse_arguments():
     return parser.parse_args()
 
 
-def load_workflow_json(workflow_path):
-    """Load and parse the workflow JSON file"""
-    if not Path(workflow_path).is_file():
-        logger.error(f"Workflow file not found: {workflow_path}")
-        sys.exit(1)
-    
-    try:
-        with open(workflow_path, 'r') as f:
-            workflow_data = json.load(f)
-        return workflow_data
-    except json.JSONDecodeError as e:
-        logger.error(f"Failed to parse workflow JSON: {e}")
-        sys.exit(1)
-
-
-def get_entry_action(workflow_data):
-    """Get the entry action (FunctionInvoke) from workflow"""
-    entry_action = workflow_data.get("FunctionInvoke")
-    if not entry_action:
-        logger.error("FunctionInvoke not found in workflow JSON")
-        sys.exit(1)
-    
-    if entry_action not in workflow_data.get("ActionList", {}):
-        logger.error(f"Entry action '{entry_action}' not found in ActionList")
-        sys.exit(1)
-    
-    logger.info(f"Entry action: {entry_action}")
-    return entry_action
-
-
 def get_github_actions_config(workflow_data, entry_action):
     """Extract GitHub Actions configuration"""
     try:
@@ -91,17 +74,9 @@ def get_github_actions_config(workflow_data, entry_action):
         sys.exit(1)
 
 
-def get_workflow_yaml_path(workflow_name, entry_action):
-    """Get the path to the workflow YAML file"""
-    workflow_file = f"{workflow_name}-{entry_action}.yml"
-    yaml_path = f".github/workflows/{workflow_file}"
-    
-    return yaml_path, workflow_file
-
-
 def check_workflow_registered(yaml_path):
     """Check if workflow YAML file exists"""
-    if not Path(yaml_path).is_file():
+    if not os.path.isfile(yaml_path):
         logger.error(f"Workflow YAML file not found: {yaml_path}")
         logger.error("")
         logger.error("This workflow has not been registered yet.")
@@ -111,41 +86,23 @@ def check_workflow_registered(yaml_path):
     return True
 
 
-def read_workflow_yaml(yaml_path):
-    """Read existing workflow YAML file"""
-    try:
-        with open(yaml_path, 'r') as f:
-            workflow_yaml = yaml.safe_load(f)
-        return workflow_yaml
-    except yaml.YAMLError as e:
-        logger.error(f"Failed to parse workflow YAML: {e}")
-        sys.exit(1)
-
-
 def unset_timer_in_yaml(workflow_yaml):
     """
     Remove cron schedule from workflow YAML and restore to manual-only mode
     This reverses the changes made by set_timer
     """
     
-    # Handle 'on' key (PyYAML sometimes parses it as True or 'true')
-    on_section = None
-    on_key = None
-    
-    for key in ['on', True, 'true']:
-        if key in workflow_yaml:
-            on_section = workflow_yaml[key]
-            on_key = key
+    # The loader reads 'on' as a string; True/'true' only come from parses
+    # cached by older versions or hand-written 'true:' keys. The section is
+    # popped and put back as 'on' below
+    for key in ('on', True, 'true'):
+        on_section = workflow_yaml.pop(key, None)
+        if on_section is not None:
             break
-    
-    if on_section is None:
+    else:
         logger.error("Could not find 'on' section in workflow YAML")
         sys.exit(1)
     
-    # Remove old key if it's not 'on'
-    if on_key != 'on':
-        del workflow_yaml[on_key]
-    
     had_schedule = False
     
     # CHANGE 1: Remove schedule section
@@ -202,117 +159,98 @@ def unset_timer_in_yaml(workflow_yaml):
     return workflow_yaml, had_schedule
 
 
-def write_workflow_yaml(yaml_path, workflow_yaml):
-    """Write updated workflow YAML back to file with proper key ordering"""
-    try:
-        # Custom representer to handle GitHub Actions expressions
-        def str_representer(dumper, data):
-            if '${{' in data and '}}' in data:
-                # Don't quote strings with GitHub Actions expressions
-                return dumper.represent_scalar('tag:yaml.org,2002:str', data, style='')
-            return dumper.represent_scalar('tag:yaml.org,2002:str', data)
-        
-        yaml.add_representer(str, str_representer)
-        
-        # CRITICAL: Rebuild workflow_yaml in the correct order
-        # GitHub Actions convention: name → on → jobs → everything else
-        ordered_workflow = {}
-        
-        # Order 1: name (if exists)
-        if 'name' in workflow_yaml:
-            ordered_workflow['name'] = workflow_yaml['name']
-        
-        # Order 2: on
-        if 'on' in workflow_yaml:
-            ordered_workflow['on'] = workflow_yaml['on']
-        
-        # Order 3: jobs
-        if 'jobs' in workflow_yaml:
-            ordered_workflow['jobs'] = workflow_yaml['jobs']
-        
-        # Order 4: any other keys
-        for key in workflow_yaml:
-            if key not in ['name', 'on', 'jobs']:
-                ordered_workflow[key] = workflow_yaml[key]
-        
-        # Dump YAML with ordered structure
-        yaml_content = yaml.dump(
-            ordered_workflow,
-            default_flow_style=False,
-            sort_keys=False,
-            width=1000,
-            allow_unicode=True
-        )
-        
-        # Fix 'on:' being converted to something else
-        yaml_content = yaml_content.replace('true:', 'on:', 1)
-        yaml_content = yaml_content.replace('"on":', 'on:', 1)
-        yaml_content = yaml_content.replace("'on':", 'on:', 1)
-        
-        with open(yaml_path, 'w') as f:
-            f.write(yaml_content)
-        
-        logger.info(f"✓ Wrote updated YAML to: {yaml_path}")
-        
-    except Exception as e:
-        logger.error(f"Failed to write workflow YAML: {e}")
-        sys.exit(1)
+# Env value with the scheduled-run fallback that set_workflow_timer writes
+_ENV_FALLBACK_RE = re.compile(r"\$\{\{ github\.event\.inputs\.(OVERWRITTEN|PAYLOAD_URL) \|\| '(?:[^']|'')*' \}\}")
+
+
+def _restore_input_text(body):
+    """Make a workflow_dispatch input block required again without a default, or None"""
+    required = re.search(r'^([ \t]+)required:[ \t]*(true|false)[ \t]*\n', body, re.M)
+    if not required:
+        return None
+    indent = required.group(1)
+    
+    # A default's value ends where the next line at the input's own indent
+    # starts; blank lines are only taken when more of the value follows them
+    body = re.sub(rf'^{indent}default:.*\n(?:(?:[ \t]*\n)*{indent}[ \t]+\S.*\n)*', '', body, flags=re.M)
+    if re.search(r'^[ \t]+default:', body, re.M):
+        return None
+    return re.sub(r'^[ \t]+required:.*\n', f"{indent}required: true\n", body, count=1, flags=re.M)
+
+
+def _restore_env_text(text):
+    """Remove the scheduled-run fallbacks from OVERWRITTEN/PAYLOAD_URL env lines, or None"""
+    parts = []
+    pos = 0
+    for m in ENV_LINE_RE.finditer(text):
+        key, value = m.groups()
+        if '||' not in value:
+            continue
+        fallback = _ENV_FALLBACK_RE.fullmatch(value)
+        if not fallback or fallback.group(1) != key:
+            return None
+        parts += [text[pos:m.start(2)], f"${{{{ github.event.inputs.{key} }}}}"]
+        pos = m.end(2)
+    parts.append(text[pos:])
+    return ''.join(parts)
+
+
+def unset_timer_in_text(text):
+    """
+    Apply the unset_timer_in_yaml edits directly to workflow YAML text
+    Returns the patched text (unchanged when there is no schedule), or None
+    when the layout is not recognised
+    """
+    parts = split_on_block(text)
+    if parts is None:
+        return None
+    head, on_body, rest, indent = parts
+    
+    # CHANGE 1: Remove schedule section
+    block = SCHEDULE_BLOCK_RE.search(on_body)
+    if not block:
+        return None if re.search(r'^[ \t]+schedule:', on_body, re.M) else text
+    if block.group(1) != indent or len(re.findall(r'^[ \t]+schedule:', on_body, re.M)) != 1:
+        return None
+    on_body = on_body[:block.start()] + on_body[block.end():]
+    if not on_body.strip():
+        return None
+    
+    # CHANGE 2: Restore workflow_dispatch inputs to required=true, remove defaults
+    for key in ('OVERWRITTEN', 'PAYLOAD_URL'):
+        block = find_input_block(on_body, key)
+        if block is False:
+            return None
+        if block:
+            restored = _restore_input_text(block.group(2))
+            if restored is None:
+                return None
+            on_body = on_body[:block.start(2)] + restored + on_body[block.end(2):]
+    
+    # CHANGE 3: Remove || operator from env vars
+    head = _restore_env_text(head)
+    rest = _restore_env_text(rest)
+    if head is None or rest is None:
+        return None
+    return head + on_body + rest
 
 
 def commit_and_push_changes(yaml_path, workflow_file, branch, had_changes):
     """Commit and push changes to GitHub"""
-    import subprocess
-    
     if not had_changes:
         logger.info("No changes to commit")
         return
     
-    try:
-        # Check if there are actually changes
-        result = subprocess.run(
-            ['git', 'diff', '--quiet', yaml_path],
-            capture_output=True
-        )
-        
-        if result.returncode == 0:
-            logger.info("No changes detected in file")
-            return
-        
-        subprocess.run(['git', 'add', yaml_path], check=True, capture_output=True)
-        
-        commit_msg = f"FaaSr: Unset workflow timer for {workflow_file}"
-        
-        subprocess.run(
-            ['git', 'commit', '-m', commit_msg],
-            check=True,
-            capture_output=True
-        )
-        
-        subprocess.run(
-            ['git', 'push', 'origin', branch],
-            check=True,
-            capture_output=True
-        )
-        
-        logger.info(f"✓ Committed and pushed to branch: {branch}")
-        
-    except subprocess.CalledProcessError as e:
-        logger.error("Git operation failed")
-        if e.stdout:
-            logger.error(f"Output: {e.stdout.decode()}")
-        if e.stderr:
-            logger.error(f"Error: {e.stderr.decode()}")
-        sys.exit(1)
+    commit_msg = f"FaaSr: Unset workflow timer for {workflow_file}"
+    commit_and_push(yaml_path, commit_msg, branch, "No changes detected in file")
 
 
 def main():
     """Main execution function"""
     args = parse_arguments()
     
-    gh_token = os.getenv("GH_PAT")
-    if not gh_token:
-        logger.error("GH_PAT environment variable not set")
-        sys.exit(1)
+    # Fail fast on missing configuration before any parsing
+    preflight(args.workflow_file, "GH_PAT")
     
     workflow_data = load_workflow_json(args.workflow_file)
     
@@ -326,11 +264,25 @@ def main():
     yaml_path, workflow_file = get_workflow_yaml_path(workflow_name, entry_action)
     check_workflow_registered(yaml_path)
     
-    workflow_yaml = read_workflow_yaml(yaml_path)
-    workflow_yaml, had_schedule = unset_timer_in_yaml(workflow_yaml)
+    # Without a schedule key anywhere in the file there is nothing to unset.
+    # Otherwise patch the YAML text in place when its layout is recognised,
+    # falling back to reading, updating, and writing the parsed YAML
+    text = Path(yaml_path).read_text()
+    patched = unset_timer_in_text(text) if 'schedule' in text else text
+    if patched is not None:
+        had_schedule = patched != text
+        if had_schedule:
+            write_text_atomic(yaml_path, patched)
+            logger.info(f"✓ Removed schedule and restored required inputs in: {yaml_path}")
+        else:
+            logger.info("No schedule found in workflow")
+    else:
+        workflow_yaml = read_workflow_yaml(yaml_path)
+        workflow_yaml, had_schedule = unset_timer_in_yaml(workflow_yaml)
+        if had_schedule:
+            write_workflow_yaml(yaml_path, workflow_yaml)
     
     if had_schedule:
-        write_workflow_yaml(yaml_path, workflow_yaml)
         commit_and_push_changes(yaml_path, workflow_file, gh_config['branch'], had_schedule)
     else:
         logger.info("No timer was set - nothing to unset")
@@ -0,0 +1,59 @@
+"""
+The croniter-free cron path in set_workflow_timer must agree with croniter
+"""
+import os
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+
+croniter = pytest.importorskip("croniter").croniter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts"))
+import set_workflow_timer  # noqa: E402
+
+EXPRESSIONS = [
+    # Stepped weekdays
+    "0 0 * * 1/3",
+    "0 0 * * 6/2",
+    "0 0 * * 3/4",
+    "0 0 * * */2",
+    "0 0 * * 1-5/2",
+    "15 8 * * 0/7",
+    # Stepped days of the month
+    "0 0 */5 * *",
+    "0 0 1/10 * *",
+    "0 0 3/7 * *",
+    "30 6 5-25/4 * *",
+    "0 0 31/2 * *",
+    # One-value ranges, which croniter reads as the whole cycle
+    "0 0 * * 7-7",
+    "0 0 15-15 * *",
+    "0 12-12 * * *",
+    "59/10 * * * *",
+    # Plain fields that stay on the fast path
+    "*/5 * * * *",
+    "0 0 * * 0",
+    "0 0 * * 7",
+    "30 2 * * 1-5",
+    "0 0 * * 5-7",
+    "0 0 29 2 *",
+    "0,30 9-17 * 3-9/2 *",
+]
+
+STARTS = [
+    datetime(2024, 2, 28, 23, 59) + timedelta(days=day, hours=day * 7 % 24)
+    for day in range(0, 1200, 37)
+]
+
+
+@pytest.mark.parametrize("cron_expr", EXPRESSIONS)
+def test_next_run_matches_croniter(cron_expr):
+    for start in STARTS:
+        expected = croniter(cron_expr, start).get_next(datetime)
+        assert set_workflow_timer._next_cron_run(cron_expr, start) == expected, start
+
+
+@pytest.mark.parametrize("cron_expr", ["0 0 * * 1/3", "0 0 * * */2", "0 0 * * 7-7", "0 12-12 * * *"])
+def test_fast_path_defers_to_croniter(cron_expr):
+    assert set_workflow_timer._parse_cron_fields(cron_expr) is None
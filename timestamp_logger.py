@@ -4,6 +4,11 @@ import json
 from datetime import datetime
 from FaaSr_py.client.py_client_stubs import faasr_invocation_id, faasr_log, faasr_put_file
 
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib serializer
+    orjson = None
+
 def timestamp_logger(folder, tag):
     """
     Logs the current timestamp to a file in S3
@@ -25,8 +30,14 @@ def timestamp_logger(folder, tag):
         "timestamp": t
     }
     
-    with open(local_filepath, 'w') as f:
-        f.write(json.dumps(content, indent=2))
+    # Compact single-line JSON, written with one unbuffered write
+    if orjson:
+        payload = orjson.dumps(content)
+    else:
+        payload = json.dumps(content, separators=(',', ':')).encode()
+    
+    with open(local_filepath, 'wb', buffering=0) as f:
+        f.write(payload)
     
     faasr_log(f"Created timestamp file: {filename} with timestamp: {t}")
     